@@ -4,26 +4,59 @@ Main bot orchestrator that runs Discord and Telegram handlers concurrently.
 """
 
 import asyncio
+import atexit
 import logging
+import queue
 import signal
 import sys
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from .config import config, DATA_DIR
 from .ollama_client import ollama_client
 from .memory_manager import memory_manager
 from .scheduler_manager import scheduler_manager
-from .discord_handler import discord_handler
-from .telegram_handler import telegram_handler
-from .dashboard import run_dashboard
 from .skills_manager import skill_manager
 
+# Platform handlers are imported on first use (discord.py / python-telegram-bot
+# are heavy), so these stay None unless that platform was actually started.
+discord_handler = None
+telegram_handler = None
+
 # Set up logging
-logging.basicConfig(
-    level=getattr(logging, config.bot.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+# Records are handed to a queue on the event loop thread; a background listener
+# thread does the actual (blocking) console and file writes.
+_log_queue = queue.SimpleQueue()
+log_listener: Optional[QueueListener] = None
+
+
+def start_log_listener():
+    """Start the thread that drains the log queue; call after any daemon fork (threads don't survive it)"""
+    global log_listener
+    if log_listener is not None:
+        return
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(DATA_DIR / 'youclaw.log')
+        RotatingFileHandler(DATA_DIR / 'youclaw.log', maxBytes=10_000_000, backupCount=3)
     ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    # Drain and stop only at interpreter exit, after every last shutdown record;
+    # registered after logging's own hook, so it runs before handlers are closed
+    atexit.register(log_listener.stop)
+
+
+# Resolve LOG_LEVEL once; unknown names fall back to INFO instead of crashing.
+# (getLevelName maps known names to ints; logging.getLevelNamesMapping is 3.11+)
+_log_level = logging.getLevelName(config.bot.log_level.upper())
+if not isinstance(_log_level, int):
+    _log_level = logging.INFO
+
+logging.basicConfig(
+    level=_log_level,
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger(__name__)
@@ -37,6 +70,10 @@ class YouClaw:
         self.platform_tasks = []
         self.dashboard_task = None
         self.stop_event = asyncio.Event()
+        self._shutdown_lock = asyncio.Lock()
+        self._shutdown_done = False
+        self._restart_lock = asyncio.Lock()
+        self._restart_pending = False
     
     async def initialize(self):
         """Initialize bot cores"""
@@ -73,8 +110,12 @@ class YouClaw:
             task.cancel()
         self.platform_tasks = []
         
+        global discord_handler, telegram_handler
+        
         if config.discord.enabled and config.discord.token:
             logger.info("Starting Discord handler...")
+            if discord_handler is None:
+                from .discord_handler import discord_handler
             task = asyncio.create_task(discord_handler.start())
             self.platform_tasks.append(task)
         elif config.discord.enabled:
@@ -82,6 +123,8 @@ class YouClaw:
 
         if config.telegram.enabled and config.telegram.token:
             logger.info("Starting Telegram handler...")
+            if telegram_handler is None:
+                from .telegram_handler import telegram_handler
             task = asyncio.create_task(telegram_handler.start())
             self.platform_tasks.append(task)
         elif config.telegram.enabled:
@@ -102,63 +145,122 @@ class YouClaw:
     
     async def restart_handlers(self):
         """Refresh config and restart platform handlers ONLY (keep dashboard alive)"""
-        logger.info("♻️ Restarting handlers with fresh config...")
-        
-        # Stop current platform handlers
-        await discord_handler.stop()
-        await telegram_handler.stop()
-        
-        # Refresh configuration from database
-        await config.refresh_from_db()
-        
-        # Start platforms again
-        await self._start_platforms()
-        logger.info("✅ Handlers restarted successfully")
+        # Serialized: two overlapping restarts would stop/start the same handlers at once
+        async with self._restart_lock:
+            logger.info("♻️ Restarting handlers with fresh config...")
+            
+            # Stop current platform handlers (concurrently, both close handshakes overlap)
+            await self._gather_logged(*self._handler_stops())
+            
+            # Refresh configuration from database
+            await config.refresh_from_db()
+            
+            # Start platforms again
+            await self._start_platforms()
+            logger.info("✅ Handlers restarted successfully")
+
+    def schedule_restart(self, delay: float = 0.5):
+        """Debounced restart_handlers: settings saves within `delay` share one restart"""
+        if self._restart_pending:
+            return
+        self._restart_pending = True
+        asyncio.create_task(self._debounced_restart(delay))
+
+    async def _debounced_restart(self, delay: float):
+        await asyncio.sleep(delay)
+        # Clear before restarting so a save that lands mid-restart queues a fresh one
+        self._restart_pending = False
+        await self.restart_handlers()
 
     async def shutdown(self):
-        """Gracefully shutdown all components"""
-        logger.info("🛑 Shutting down YouClaw...")
-        self.running = False
-        
-        # Set stop event to break the start() wait
-        self.stop_event.set()
-        
-        # Cancel all platform tasks
-        for task in self.platform_tasks:
-            task.cancel()
-        
-        # Cancel dashboard
-        if self.dashboard_task:
-            self.dashboard_task.cancel()
-        
-        # Stop platform handlers
-        await discord_handler.stop()
-        await telegram_handler.stop()
-        
-        # Close connections
-        await ollama_client.close()
-        await memory_manager.close()
-        
-        logger.info("👋 YouClaw shutdown complete")
+        """Gracefully shutdown all components (runs at most once)"""
+        async with self._shutdown_lock:
+            if self._shutdown_done:
+                return
+            self._shutdown_done = True
+
+            logger.info("🛑 Shutting down YouClaw...")
+            self.running = False
+            
+            # Set stop event to break the start() wait
+            self.stop_event.set()
+            
+            # Cancel all platform tasks and wait for them to unwind
+            for task in self.platform_tasks:
+                task.cancel()
+            await asyncio.gather(*self.platform_tasks, return_exceptions=True)
+            self.platform_tasks.clear()
+            
+            # Cancel dashboard
+            if self.dashboard_task:
+                self.dashboard_task.cancel()
+            
+            # Stop platform handlers
+            await self._gather_logged(*self._handler_stops())
+            
+            # Close connections
+            await self._gather_logged(
+                ("Ollama client", ollama_client.close()),
+                ("Memory manager", memory_manager.close()),
+            )
+            
+            logger.info("👋 YouClaw shutdown complete")
+    
+    @staticmethod
+    def _handler_stops():
+        """(name, stop coroutine) pairs for the platform handlers that were loaded"""
+        stops = []
+        if discord_handler is not None:
+            stops.append(("Discord handler", discord_handler.stop()))
+        if telegram_handler is not None:
+            stops.append(("Telegram handler", telegram_handler.stop()))
+        return stops
+    
+    @staticmethod
+    async def _gather_logged(*named_coros):
+        """Run (name, coroutine) pairs concurrently and log each failure on its own"""
+        names = [name for name, _ in named_coros]
+        results = await asyncio.gather(*(coro for _, coro in named_coros), return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{name} failed to stop cleanly: {result}")
     
     def handle_signal(self, sig):
-        """Handle shutdown signals"""
+        """Handle shutdown signals by waking start(); main() then runs shutdown()"""
         logger.info(f"Received signal {sig}, initiating shutdown...")
-        asyncio.create_task(self.shutdown())
+        self.stop_event.set()
 
 
 # Global bot instance
 youclaw_bot = YouClaw()
 
+
+def run_with_uvloop(coro):
+    """asyncio.run(coro) on uvloop's libuv-backed event loop if available (not on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 12):
+        # uvloop.install() is deprecated on 3.12+; hand asyncio.run the loop factory instead
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 async def main():
     """Main entry point"""
+    from .dashboard import run_dashboard
+    
+    start_log_listener()
+    
     # Initialize cores
     await youclaw_bot.initialize()
     
     # Set up signal handlers
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, lambda s=sig: youclaw_bot.handle_signal(s))
+        loop.add_signal_handler(sig, youclaw_bot.handle_signal, sig)
     
     try:
         # Start Dashboard as a background task
@@ -174,12 +276,13 @@ async def main():
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
     finally:
+        # Single shutdown path for signals, errors and normal exit
         await youclaw_bot.shutdown()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_with_uvloop(main())
     except KeyboardInterrupt:
         pass
 
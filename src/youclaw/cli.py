@@ -6,10 +6,15 @@ Provides commands for installation, health checks, and management.
 import sys
 import subprocess
 import os
+import json
+import mmap
+import shutil
 import signal
+import socket
 import time
 import asyncio
 import argparse
+from http.client import HTTPConnection
 from pathlib import Path
 
 # Add parent directory to path for imports if running locally
@@ -17,6 +22,23 @@ if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent))
 
 
+def _alive(pid: int) -> bool:
+    """Is pid a live (non-zombie) process? Reads procfs on Linux, else probes with kill(pid, 0)"""
+    if sys.platform == "linux":
+        try:
+            with open(f"/proc/{pid}/status", "rb") as f:
+                return b"zombie" not in f.read(256).lower()
+        except FileNotFoundError:
+            return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, but owned by someone else
+
+
 class YouClawCLI:
     """YouClaw command line interface"""
     
@@ -32,14 +54,28 @@ class YouClawCLI:
             print("❌ install.sh not found!")
             return 1
         
-        result = subprocess.run(["bash", str(install_script)])
-        return result.returncode
+        argv = ["bash", str(install_script)]
+        if not hasattr(os, "posix_spawnp"):
+            # Windows: no posix_spawn, fall back to subprocess
+            return subprocess.run(argv).returncode
+        
+        # No pipes to wire up, so spawn + wait directly instead of going through Popen
+        pid = os.posix_spawnp("bash", argv, os.environ)
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
     
     def cmd_check(self, args):
         """Run health checks"""
         print("🦞 YouClaw Health Check")
         print("=" * 50)
         
+        # A live PID file answers the service question without systemd; only
+        # otherwise launch systemctl up front so it runs while we check locally
+        daemon_pid = self._running_pid()
+        systemd_probe = None
+        if daemon_pid is None:
+            systemd_probe = self._spawn(["systemctl", "--user", "is-active", "youclaw"])
+        
         # Check Python version
         print("\n📦 Python Version:")
         python_version = sys.version.split()[0]
@@ -52,23 +88,28 @@ class YouClawCLI:
         # Check Ollama
         print("\n🤖 Ollama:")
         try:
-            result = subprocess.run(
-                ["curl", "-s", "http://localhost:11434/api/tags"],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
+            conn = HTTPConnection("localhost", 11434, timeout=5)
+            try:
+                conn.request("GET", "/api/tags")
+                response = conn.getresponse()
+                body = response.read()
+            finally:
+                conn.close()
+            if response.status == 200:
                 print("   Connected ✅")
                 # Parse models
-                import json
                 try:
-                    data = json.loads(result.stdout)
+                    data = json.loads(body)
                     models = [m["name"] for m in data.get("models", [])]
                     print(f"   Models: {', '.join(models) if models else 'None'}")
                 except:
                     pass
             else:
                 print("   Not running ❌")
+        except ConnectionRefusedError:
+            print("   Not running ❌")
+        except socket.timeout:
+            print("   Error: timed out ❌")
         except Exception as e:
             print(f"   Error: {e} ❌")
         
@@ -86,20 +127,22 @@ class YouClawCLI:
         if env_path.exists():
             print("   .env file exists ✅")
             # Check for tokens
-            with open(env_path) as f:
-                content = f.read()
-                has_discord = "DISCORD_BOT_TOKEN=" in content and "your_discord" not in content
-                has_telegram = "TELEGRAM_BOT_TOKEN=" in content and "your_telegram" not in content
-                
-                if has_discord:
-                    print("   Discord token configured ✅")
-                else:
-                    print("   Discord token not set ⚠️")
-                
-                if has_telegram:
-                    print("   Telegram token configured ✅")
-                else:
-                    print("   Telegram token not set ⚠️")
+            has_discord = has_telegram = False
+            with open(env_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        has_discord = mm.find(b"DISCORD_BOT_TOKEN=") != -1 and mm.find(b"your_discord") == -1
+                        has_telegram = mm.find(b"TELEGRAM_BOT_TOKEN=") != -1 and mm.find(b"your_telegram") == -1
+            
+            if has_discord:
+                print("   Discord token configured ✅")
+            else:
+                print("   Discord token not set ⚠️")
+            
+            if has_telegram:
+                print("   Telegram token configured ✅")
+            else:
+                print("   Telegram token not set ⚠️")
         else:
             print("   .env file missing ❌")
         
@@ -114,25 +157,47 @@ class YouClawCLI:
         
         # Check systemd service
         print("\n🔧 Systemd Service:")
-        try:
-            result = subprocess.run(
-                ["systemctl", "--user", "is-active", "youclaw"],
-                capture_output=True,
-                text=True
-            )
-            status = result.stdout.strip()
-            if status == "active":
-                print("   Running ✅")
-            elif status == "inactive":
-                print("   Stopped ⚠️")
-            else:
-                print(f"   Status: {status}")
-        except Exception as e:
-            print(f"   Not installed ⚠️")
+        if daemon_pid is not None:
+            print(f"   Running ✅ (PID: {daemon_pid})")
+        else:
+            try:
+                if isinstance(systemd_probe, Exception):
+                    raise systemd_probe
+                stdout, _ = systemd_probe.communicate(timeout=5)
+                status = stdout.decode(errors="ignore").strip()
+                if status == "active":
+                    print("   Running ✅")
+                elif status == "inactive":
+                    print("   Stopped ⚠️")
+                else:
+                    print(f"   Status: {status}")
+            except Exception as e:
+                if isinstance(systemd_probe, subprocess.Popen):
+                    systemd_probe.kill()
+                    systemd_probe.communicate()
+                print(f"   Not installed ⚠️")
         
         print("\n" + "=" * 50)
         return 0
     
+    @staticmethod
+    def _running_pid():
+        """PID from the daemon's PID file if that process is alive, else None"""
+        from .config import DATA_DIR
+        try:
+            pid = int((DATA_DIR / "youclaw.pid").read_text().strip())
+        except (OSError, ValueError):
+            return None
+        return pid if _alive(pid) else None
+    
+    @staticmethod
+    def _spawn(cmd):
+        """Start a probe process without waiting; returns the exception if it can't start"""
+        try:
+            return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except Exception as e:
+            return e
+    
     async def cmd_status(self, args):
         """Show service status"""
         from .config import DATA_DIR
@@ -149,7 +214,8 @@ class YouClawCLI:
             pid = int(pid_file.read_text().strip())
             
             # Check if process is actually running
-            os.kill(pid, 0)
+            if not _alive(pid):
+                raise ProcessLookupError(pid)
             
             # Basic info only (simplified for reliability)
             print(f"Status: ✅ Running")
@@ -169,23 +235,82 @@ class YouClawCLI:
         """View logs"""
         from .config import DATA_DIR
         log_file = DATA_DIR / "youclaw.log"
-        print(f"🦞 YouClaw Logs: {log_file} (Ctrl+C to exit)\n")
+        print(f"🦞 YouClaw Logs: {log_file} (Ctrl+C to exit)")
+        print(f"   Daemon stdout/stderr (tracebacks, prints): {DATA_DIR / 'bot_output.log'}\n")
         
         if not log_file.exists():
             print("❌ No log file found.")
             return 1
             
-        cmd = ["tail", "-n", str(args.lines or 50)]
-        if args.follow:
-            cmd.append("-f")
-        cmd.append(str(log_file))
-        
         try:
-            result = subprocess.run(cmd)
-            return result.returncode
+            f = open(log_file, "rb")
+            offset = self._tail_offset(f, args.lines or 50)
+            while True:
+                # Copy whatever is new since the last pass
+                size = os.fstat(f.fileno()).st_size
+                while offset < size:
+                    copied = self._copy_to_stdout(f, offset, size - offset)
+                    if not copied:
+                        break
+                    offset += copied
+                
+                if not args.follow:
+                    break
+                time.sleep(0.25)
+                
+                # RotatingFileHandler renames a full youclaw.log to youclaw.log.1 and starts a
+                # fresh file: follow the new one from its start (a truncated file likewise)
+                try:
+                    rotated = os.stat(log_file).st_ino != os.fstat(f.fileno()).st_ino
+                except FileNotFoundError:
+                    continue  # Mid-rotation; try again on the next tick
+                if rotated or os.fstat(f.fileno()).st_size < offset:
+                    f.close()
+                    f = open(log_file, "rb")
+                    offset = 0
+            f.close()
+            return 0
         except KeyboardInterrupt:
             return 0
     
+    @staticmethod
+    def _tail_offset(f, lines: int) -> int:
+        """Byte offset where the last `lines` lines start, scanning backwards in blocks"""
+        end = f.seek(0, os.SEEK_END)
+        if not end:
+            return 0
+        f.seek(end - 1)
+        # A trailing newline terminates the last line rather than starting a new one
+        wanted = lines + (1 if f.read(1) == b"\n" else 0)
+        pos = end
+        while pos > 0:
+            size = min(8192, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            idx = len(chunk)
+            while True:
+                idx = chunk.rfind(b"\n", 0, idx)
+                if idx == -1:
+                    break
+                wanted -= 1
+                if wanted == 0:
+                    return pos + idx + 1
+        return 0
+    
+    @staticmethod
+    def _copy_to_stdout(f, offset: int, count: int) -> int:
+        """Copy a byte range of f to stdout, in-kernel via sendfile where supported"""
+        sys.stdout.flush()
+        try:
+            return os.sendfile(sys.stdout.fileno(), f.fileno(), offset, count)
+        except (AttributeError, OSError):
+            f.seek(offset)
+            data = f.read(min(count, 65536))
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+            return len(data)
+    
     async def run_wizard(self):
         """Interactive on-boarding wizard for YouClaw clones"""
         print("\n" + "🦞" * 10)
@@ -247,8 +372,15 @@ class YouClawCLI:
             "ADMIN_USER_IDENTITY=telegram:default"
         ]
 
-        with open(env_path, "w") as f:
-            f.write("\n".join(env_content))
+        # One write of the encoded buffer; 0o600 keeps the bot tokens private and
+        # O_CLOEXEC keeps the fd out of the forked daemon
+        buf = ("\n".join(env_content) + "\n").encode("utf-8")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+        fd = os.open(env_path, flags, 0o600)
+        try:
+            os.write(fd, buf)
+        finally:
+            os.close(fd)
 
         print("\n✨ Configuration Synced Successfully!")
         print("🔗 Mission Control will be available at: http://localhost:8080")
@@ -269,14 +401,15 @@ class YouClawCLI:
         if pid_file.exists():
             try:
                 pid = int(pid_file.read_text().strip())
-                # Check if process is actually running
-                os.kill(pid, 0)
+            except ValueError:
+                pid = None
+            # Check if process is actually running
+            if pid is not None and _alive(pid):
                 print(f"⚠️ YouClaw is already running (PID: {pid})")
                 print("   Use 'youclaw stop' first, or 'youclaw restart'")
                 return 1
-            except (ProcessLookupError, ValueError):
-                # PID file exists but process is dead, clean it up
-                pid_file.unlink()
+            # PID file exists but process is dead, clean it up
+            pid_file.unlink()
 
         print(f"🦞 Starting YouClaw v4.8.9 in background...")
         
@@ -288,15 +421,21 @@ class YouClawCLI:
 
         # Start as background daemon (Default)
         try:
-            # import sys and os already at module level
-            
-            # Fork the process
+            # Classic double fork: the first child starts a new session and forks
+            # the real daemon, so the daemon can never reacquire a controlling tty
+            # and the parent can reap the short-lived first child immediately.
+            sys.stdout.flush()
+            sys.stderr.flush()
             pid = os.fork()
             if pid > 0:
-                # Parent process - save PID and exit
-                pid_file.parent.mkdir(parents=True, exist_ok=True)
-                pid_file.write_text(str(pid))
-                print(f"✅ YouClaw started (PID: {pid})")
+                # Parent process - reap the first child, report the daemon PID and exit
+                os.waitpid(pid, 0)
+                try:
+                    daemon_pid = int(pid_file.read_text().strip())
+                except (OSError, ValueError):
+                    print("❌ Launch Fault: daemon did not report its PID")
+                    return 1
+                print(f"✅ YouClaw started (PID: {daemon_pid})")
                 print("🔗 Dashboard: http://localhost:8080")
                 print("\nManage with:")
                 print("  youclaw status   - Check status")
@@ -304,17 +443,27 @@ class YouClawCLI:
                 print("  youclaw restart  - Restart service")
                 return 0
             
-            # Child process - become daemon
-            os.setsid()  # Create new session
+            # First child - new session, then fork the daemon and save its PID
+            os.setsid()
+            daemon_pid = os.fork()
+            if daemon_pid > 0:
+                pid_file.parent.mkdir(parents=True, exist_ok=True)
+                pid_file.write_text(str(daemon_pid))
+                os._exit(0)
             
-            # Redirect stdout/stderr to log file
-            log_file = open("youclaw.log", "a")
-            os.dup2(log_file.fileno(), sys.stdout.fileno())
-            os.dup2(log_file.fileno(), sys.stderr.fileno())
+            # Daemon - detach stdio: stdin from /dev/null, stdout/stderr to bot_output.log
+            # beside youclaw.log (not into it: the logger already writes every record there)
+            null_fd = os.open(os.devnull, os.O_RDONLY)
+            log_fd = os.open(DATA_DIR / "bot_output.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            os.dup2(null_fd, sys.stdin.fileno())
+            os.dup2(log_fd, sys.stdout.fileno())
+            os.dup2(log_fd, sys.stderr.fileno())
+            os.close(null_fd)
+            os.close(log_fd)
             
             # Run the bot
-            from .bot import main
-            asyncio.run(main())
+            from .bot import main, run_with_uvloop
+            run_with_uvloop(main())
             
         except AttributeError:
             # Windows doesn't support fork, run in foreground
@@ -346,22 +495,28 @@ class YouClawCLI:
             # Send SIGTERM for graceful shutdown
             os.kill(pid, signal.SIGTERM)
             
-            # Wait up to 10 seconds for process to stop
-            import time
-            for _ in range(10):
+            # Wait up to 10 seconds for process to stop, polling with exponential backoff
+            deadline = time.monotonic() + 10
+            delay = 0.01
+            while time.monotonic() < deadline:
                 try:
-                    os.kill(pid, 0)  # Check if still running
-                    time.sleep(1)
-                except ProcessLookupError:
+                    # Reap it if it's our own child so it doesn't linger as a zombie
+                    if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                        break
+                except (ChildProcessError, AttributeError):
+                    pass  # Not our child / already reaped / no WNOHANG on Windows
+                if not _alive(pid):
                     break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.25)
             
             # Force kill if still running
-            try:
-                os.kill(pid, 0)
+            if _alive(pid):
                 print("⚠️ Process didn't stop gracefully, forcing...")
-                os.kill(pid, signal.SIGKILL)
-            except ProcessLookupError:
-                pass
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
             
             pid_file.unlink()
             print("✅ YouClaw stopped")
@@ -379,7 +534,6 @@ class YouClawCLI:
         """Restart YouClaw service"""
         print("🦞 Restarting YouClaw...")
         self.cmd_stop(args)
-        import time
         time.sleep(1)  # Brief pause
         return self.cmd_start(args)
     
@@ -392,6 +546,8 @@ class YouClawCLI:
         # Import and run dashboard
         try:
             from dashboard import run_dashboard
+            from .bot import start_log_listener
+            start_log_listener()  # Otherwise queued log records are never written
             asyncio.run(run_dashboard(port=args.port))
         except ImportError as e:
             print(f"❌ Dashboard module not found. Make sure dashboard.py exists. Error: {e}")
@@ -413,7 +569,6 @@ class YouClawCLI:
         
         # Remove data
         try:
-            import shutil
             data_dir = self.project_dir / "data"
             if data_dir.exists():
                 print(f"🗑️ Removing {data_dir}...")
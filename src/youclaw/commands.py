@@ -3,44 +3,91 @@ YouClaw Command Handler
 Handles bot commands across all platforms.
 """
 
+import asyncio
 import logging
+import re
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from .ollama_client import ollama_client
 from .memory_manager import memory_manager
 
 logger = logging.getLogger(__name__)
 
+# Static reply texts, built once at import
+_HELP_TEXT = """🦞 **YouClaw - Your Personal AI Assistant**
+
+**Available Commands:**
+• `!help` or `/help` - Show this help message
+• `!reset` or `/reset` - Clear conversation history
+• `!model [name]` or `/model [name]` - Show or switch AI model
+• `!models` or `/models` - List available models
+• `!stats` or `/stats` - Show bot statistics
+
+**How to use:**
+Just talk to me naturally! I'll remember our conversation and provide intelligent responses using my local AI brain (Ollama).
+
+I work across Discord and Telegram, and I'll remember you on both platforms!"""
+
+_STATS_TEMPLATE = """📊 **YouClaw Statistics**
+
+**Memory:**
+• Total messages: {total_messages}
+• Unique users: {unique_users}
+• Database: `{database_path}`
+
+**AI Engine:**
+• Model: `{model}`
+• Status: {status}
+• Host: `{host}`"""
+
+_MODEL_NOT_FOUND_TEMPLATE = "❌ Model `{model}` not found.\n\n**Available models:**\n• {models}"
+
+_NO_MODELS_TEXT = "❌ No models found. Make sure Ollama is running and has models installed."
+
 
 class CommandHandler:
     """Handles bot commands"""
     
+    __slots__ = ("prefix", "_lead", "_re", "_dispatch")
+    
     def __init__(self, prefix: str = "!"):
         self.prefix = prefix
-        self.commands = {
+        # Bound methods resolved once; read-only so dispatch is a plain dict probe
+        self._dispatch = MappingProxyType({
             "help": self.cmd_help,
             "reset": self.cmd_reset,
             "model": self.cmd_model,
             "stats": self.cmd_stats,
             "models": self.cmd_models,
-        }
+        })
+        # First characters that can start a command (whitespace is checked separately)
+        self._lead = frozenset((prefix[:1] or "/", "/"))
+        # One pass: optional leading whitespace, prefix, command word, rest as args
+        self._re = re.compile(rf'^\s*(?:{re.escape(prefix)}|/)\s*(\S*)\s*(.*)$', re.DOTALL)
+    
+    @property
+    def commands(self):
+        """Read-only view of the command dispatch table"""
+        return self._dispatch
+    
+    def match_command(self, message: str) -> Optional[tuple[str, list[str]]]:
+        """Return (command, args) if message is a command, otherwise None"""
+        # Fast path: almost all chat messages are rejected on their first character
+        if not message or (message[0] not in self._lead and not message[0].isspace()):
+            return None
+        match = self._re.match(message)
+        if not match:
+            return None
+        command, rest = match.groups()
+        return command.lower(), rest.split()
     
     def is_command(self, message: str) -> bool:
         """Check if message is a command"""
-        return message.strip().startswith(self.prefix) or message.strip().startswith("/")
+        return self.match_command(message) is not None
     
     def parse_command(self, message: str) -> tuple[str, list[str]]:
         """Parse command and arguments"""
-        # Remove prefix
-        if message.startswith(self.prefix):
-            message = message[len(self.prefix):]
-        elif message.startswith("/"):
-            message = message[1:]
-        
-        parts = message.strip().split()
-        command = parts[0].lower() if parts else ""
-        args = parts[1:] if len(parts) > 1 else []
-        
-        return command, args
+        return self.match_command(message) or ("", [])
     
     async def handle_command(
         self,
@@ -61,35 +108,25 @@ class CommandHandler:
         Returns:
             Response string or None if not a command
         """
-        if not self.is_command(message):
+        parsed = self.match_command(message)
+        if parsed is None:
             return None
         
-        command, args = self.parse_command(message)
+        command, args = parsed
         
-        if command in self.commands:
-            try:
-                return await self.commands[command](platform, user_id, args, **kwargs)
-            except Exception as e:
-                logger.error(f"Error executing command {command}: {e}")
-                return f"❌ Error executing command: {str(e)}"
-        else:
+        handler = self._dispatch.get(command)
+        if handler is None:
             return f"❓ Unknown command: `{command}`. Type `{self.prefix}help` for available commands."
+        
+        try:
+            return await handler(platform, user_id, args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error executing command {command}: {e}")
+            return f"❌ Error executing command: {str(e)}"
     
     async def cmd_help(self, platform: str, user_id: str, args: list, **kwargs) -> str:
         """Show help message"""
-        return """🦞 **YouClaw - Your Personal AI Assistant**
-
-**Available Commands:**
-• `!help` or `/help` - Show this help message
-• `!reset` or `/reset` - Clear conversation history
-• `!model [name]` or `/model [name]` - Show or switch AI model
-• `!models` or `/models` - List available models
-• `!stats` or `/stats` - Show bot statistics
-
-**How to use:**
-Just talk to me naturally! I'll remember our conversation and provide intelligent responses using my local AI brain (Ollama).
-
-I work across Discord and Telegram, and I'll remember you on both platforms!"""
+        return _HELP_TEXT
     
     async def cmd_reset(self, platform: str, user_id: str, args: list, **kwargs) -> str:
         """Reset conversation history"""
@@ -112,14 +149,14 @@ I work across Discord and Telegram, and I'll remember you on both platforms!"""
         else:
             models = await ollama_client.get_available_models()
             models_list = "\n• ".join(models) if models else "None"
-            return f"❌ Model `{model_name}` not found.\n\n**Available models:**\n• {models_list}"
+            return _MODEL_NOT_FOUND_TEMPLATE.format(model=model_name, models=models_list)
     
     async def cmd_models(self, platform: str, user_id: str, args: list, **kwargs) -> str:
         """List available models"""
         models = await ollama_client.get_available_models()
         
         if not models:
-            return "❌ No models found. Make sure Ollama is running and has models installed."
+            return _NO_MODELS_TEXT
         
         current = ollama_client.model
         models_list = "\n".join([
@@ -131,20 +168,18 @@ I work across Discord and Telegram, and I'll remember you on both platforms!"""
     
     async def cmd_stats(self, platform: str, user_id: str, args: list, **kwargs) -> str:
         """Show bot statistics"""
-        stats = await memory_manager.get_stats()
-        health = await ollama_client.check_health()
+        # Independent DB and HTTP round-trips; overlap them
+        stats, health = await asyncio.gather(
+            memory_manager.get_stats(),
+            ollama_client.check_health()
+        )
         
-        return f"""📊 **YouClaw Statistics**
-
-**Memory:**
-• Total messages: {stats['total_messages']}
-• Unique users: {stats['unique_users']}
-• Database: `{stats['database_path']}`
-
-**AI Engine:**
-• Model: `{ollama_client.model}`
-• Status: {'🟢 Online' if health else '🔴 Offline'}
-• Host: `{ollama_client.host}`"""
+        return _STATS_TEMPLATE.format_map({
+            **stats,
+            "model": ollama_client.model,
+            "status": "🟢 Online" if health else "🔴 Offline",
+            "host": ollama_client.host,
+        })
 
 
 # Global command handler instance
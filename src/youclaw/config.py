@@ -5,7 +5,7 @@ Centralized configuration with environment variable loading and validation.
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
@@ -21,11 +21,11 @@ ENV_PATH = DATA_DIR / ".env"
 
 local_env = Path(".env")
 if not ENV_PATH.exists() and local_env.exists():
-    import shutil
     try:
-        shutil.copy(local_env, ENV_PATH)
+        ENV_PATH.write_bytes(local_env.read_bytes())
         logger.info(f"✨ Migrated {local_env} to stable home.")
-    except: pass
+    except OSError as e:
+        logger.warning(f"⚠️ .env migration to {ENV_PATH} failed: {e}")
 
 # Load environment variables
 load_dotenv() # Load from CWD
@@ -33,14 +33,25 @@ if ENV_PATH.exists():
     load_dotenv(dotenv_path=ENV_PATH, override=True) # Absolute priority to stable home
 
 
-@dataclass
+def _env(key: str, default: Any, cast: Callable[[str], Any] = str) -> Any:
+    """Read one environment variable, converting it only when it is set"""
+    value = os.environ.get(key)
+    return cast(value) if value is not None else default
+
+
+def _is_true(value: str) -> bool:
+    """Parse the "true"/"false" strings used by the ENABLE_* flags"""
+    return value.lower() == "true"
+
+
+@dataclass(slots=True)
 class OllamaConfig:
     """Ollama service configuration"""
-    host: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    model: str = os.getenv("OLLAMA_MODEL", "qwen2.5:1.5b-instruct")
-    temperature: float = float(os.getenv("OLLAMA_TEMPERATURE", "0.7"))
-    max_tokens: int = int(os.getenv("OLLAMA_MAX_TOKENS", "2048"))
-    timeout: int = int(os.getenv("OLLAMA_TIMEOUT", "60"))
+    host: str = _env("OLLAMA_HOST", "http://localhost:11434")
+    model: str = _env("OLLAMA_MODEL", "qwen2.5:1.5b-instruct")
+    temperature: float = _env("OLLAMA_TEMPERATURE", 0.7, float)
+    max_tokens: int = _env("OLLAMA_MAX_TOKENS", 2048, int)
+    timeout: int = _env("OLLAMA_TIMEOUT", 60, int)
     
     def __post_init__(self):
         """Validate configuration"""
@@ -52,11 +63,11 @@ class OllamaConfig:
             self.model = "qwen2.5:1.5b-instruct"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscordConfig:
     """Discord bot configuration"""
-    token: Optional[str] = os.getenv("DISCORD_BOT_TOKEN")
-    enabled: bool = os.getenv("ENABLE_DISCORD", "true").lower() == "true"
+    token: Optional[str] = _env("DISCORD_BOT_TOKEN", None)
+    enabled: bool = _env("ENABLE_DISCORD", True, _is_true)
     
     def __post_init__(self):
         """Validate configuration"""
@@ -65,11 +76,11 @@ class DiscordConfig:
             self.enabled = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram bot configuration"""
-    token: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
-    enabled: bool = os.getenv("ENABLE_TELEGRAM", "true").lower() == "true"
+    token: Optional[str] = _env("TELEGRAM_BOT_TOKEN", None)
+    enabled: bool = _env("ENABLE_TELEGRAM", True, _is_true)
     
     def __post_init__(self):
         """Validate configuration"""
@@ -78,16 +89,16 @@ class TelegramConfig:
             self.enabled = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """General bot configuration"""
-    prefix: str = os.getenv("BOT_PREFIX", "!")
-    max_context_messages: int = int(os.getenv("MAX_CONTEXT_MESSAGES", "20"))
-    database_path: str = os.getenv("DATABASE_PATH", str(DATA_DIR / "youclaw.db"))
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    search_url: str = os.getenv("SEARCH_ENGINE_URL", "http://57.128.250.34:8080/search")
-    admin_user_identity: str = os.getenv("ADMIN_USER_IDENTITY", "telegram:default") # format platform:id
-    dashboard_port: int = int(os.getenv("DASHBOARD_PORT", "8080"))
+    prefix: str = _env("BOT_PREFIX", "!")
+    max_context_messages: int = _env("MAX_CONTEXT_MESSAGES", 20, int)
+    database_path: str = _env("DATABASE_PATH", str(DATA_DIR / "youclaw.db"))
+    log_level: str = _env("LOG_LEVEL", "INFO")
+    search_url: str = _env("SEARCH_ENGINE_URL", "http://57.128.250.34:8080/search")
+    admin_user_identity: str = _env("ADMIN_USER_IDENTITY", "telegram:default") # format platform:id
+    dashboard_port: int = _env("DASHBOARD_PORT", 8080, int)
     
     def __post_init__(self):
         """Validate configuration"""
@@ -97,87 +108,143 @@ class BotConfig:
         # Create data directory if it doesn't exist
         os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
 
-@dataclass
+@dataclass(slots=True)
 class EmailConfig:
     """Email service configuration"""
-    imap_host: str = os.getenv("EMAIL_IMAP_HOST", "")
-    imap_port: int = int(os.getenv("EMAIL_IMAP_PORT", "993"))
-    smtp_host: str = os.getenv("EMAIL_SMTP_HOST", "")
-    smtp_port: int = int(os.getenv("EMAIL_SMTP_PORT", "587"))
-    user: str = os.getenv("EMAIL_USER", "")
-    password: str = os.getenv("EMAIL_PASSWORD", "")
-    enabled: bool = os.getenv("ENABLE_EMAIL", "false").lower() == "true"
+    imap_host: str = _env("EMAIL_IMAP_HOST", "")
+    imap_port: int = _env("EMAIL_IMAP_PORT", 993, int)
+    smtp_host: str = _env("EMAIL_SMTP_HOST", "")
+    smtp_port: int = _env("EMAIL_SMTP_PORT", 587, int)
+    user: str = _env("EMAIL_USER", "")
+    password: str = _env("EMAIL_PASSWORD", "")
+    enabled: bool = _env("ENABLE_EMAIL", False, _is_true)
+
+
+# global_settings rows that override the env-based config (see Config.refresh_from_db)
+_DB_SETTING_KEYS = (
+    "discord_token", "telegram_token", "discord_enabled", "telegram_enabled",
+    "search_url",
+    "email_imap_host", "email_imap_port", "email_smtp_host", "email_smtp_port",
+    "email_user", "email_password", "email_enabled",
+    "active_model", "ollama_host",
+)
 
 
 class Config:
     """Main configuration class"""
     
-    def __init__(self):
-        self.bot = BotConfig()
-        self.ollama = OllamaConfig()
-        self.discord = DiscordConfig()
-        self.telegram = TelegramConfig()
-        self.email = EmailConfig()
-        self.search_url = os.getenv("SEARCH_ENGINE_URL", "http://57.128.250.34:8080/search")
-
-        # Refresh from database if possible
-        try:
-            # This is a bit tricky during first init, but refresh_from_db handles it
-            pass
-        except:
-             pass
+    # Fixed attribute set: no per-instance __dict__. Sub-configs live in the
+    # underscore slots and are built (and validated) on first access, not at import.
+    __slots__ = ("_bot", "_ollama", "_discord", "_telegram", "_email", "_search_url", "_settings_version")
+    
+    _instance = None
+    
+    def __new__(cls):
+        # Singleton: every Config() hands back the same, already-refreshed instance
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._bot = instance._ollama = instance._discord = None
+            instance._telegram = instance._email = instance._search_url = None
+            # settings_version last applied by refresh_from_db (-1 = never)
+            instance._settings_version = -1
+            cls._instance = instance
+        return cls._instance
+    
+    @property
+    def bot(self) -> BotConfig:
+        if self._bot is None:
+            self._bot = BotConfig()
+        return self._bot
+    
+    @property
+    def ollama(self) -> OllamaConfig:
+        if self._ollama is None:
+            self._ollama = OllamaConfig()
+        return self._ollama
+    
+    @property
+    def discord(self) -> DiscordConfig:
+        if self._discord is None:
+            self._discord = DiscordConfig()
+        return self._discord
+    
+    @property
+    def telegram(self) -> TelegramConfig:
+        if self._telegram is None:
+            self._telegram = TelegramConfig()
+        return self._telegram
+    
+    @property
+    def email(self) -> EmailConfig:
+        if self._email is None:
+            self._email = EmailConfig()
+        return self._email
+    
+    @property
+    def search_url(self) -> str:
+        if self._search_url is None:
+            self._search_url = self.bot.search_url
+        return self._search_url
+    
+    @search_url.setter
+    def search_url(self, value: str):
+        self._search_url = value
 
     async def refresh_from_db(self):
         """Refresh dynamic settings from database"""
         try:
             from .memory_manager import memory_manager
             
+            # Nothing written since the last refresh -> nothing to reload
+            version = await memory_manager.get_settings_version()
+            if version == self._settings_version:
+                return
+            
+            # One query for every setting we care about
+            values = await memory_manager.get_global_settings(_DB_SETTING_KEYS)
+            
             # Override tokens if present in DB
-            dt = await memory_manager.get_global_setting("discord_token")
+            dt = values.get("discord_token")
             if dt and dt.strip(): self.discord.token = dt
             
-            tt = await memory_manager.get_global_setting("telegram_token")
+            tt = values.get("telegram_token")
             if tt and tt.strip(): self.telegram.token = tt
             
             # Override status
-            de_val = await memory_manager.get_global_setting("discord_enabled")
+            de_val = values.get("discord_enabled")
             if de_val:
                 self.discord.enabled = de_val.lower() == "true"
             
-            te_val = await memory_manager.get_global_setting("telegram_enabled")
+            te_val = values.get("telegram_enabled")
             if te_val:
                 self.telegram.enabled = te_val.lower() == "true"
             
-            st = await memory_manager.get_global_setting("search_url")
+            st = values.get("search_url")
             if st and st.strip(): self.search_url = st
             
             # Email Settings
-            eh = await memory_manager.get_global_setting("email_imap_host")
+            eh = values.get("email_imap_host")
             if eh: self.email.imap_host = eh
-            ep = await memory_manager.get_global_setting("email_imap_port")
+            ep = values.get("email_imap_port")
             if ep: self.email.imap_port = int(ep)
-            sh = await memory_manager.get_global_setting("email_smtp_host")
+            sh = values.get("email_smtp_host")
             if sh: self.email.smtp_host = sh
-            sp = await memory_manager.get_global_setting("email_smtp_port")
+            sp = values.get("email_smtp_port")
             if sp: self.email.smtp_port = int(sp)
-            eu = await memory_manager.get_global_setting("email_user")
+            eu = values.get("email_user")
             if eu: self.email.user = eu
-            epw = await memory_manager.get_global_setting("email_password")
+            epw = values.get("email_password")
             if epw: self.email.password = epw
-            ee = await memory_manager.get_global_setting("email_enabled")
+            ee = values.get("email_enabled")
             if ee: self.email.enabled = ee.lower() == "true"
             
             # Model Persistence
-            am = await memory_manager.get_global_setting("active_model")
-            if am and am.strip():
-                self.ollama.model = am
-            # Model Persistence
-            am = await memory_manager.get_global_setting("active_model")
+            am = values.get("active_model")
             if am and am.strip():
                 self.ollama.model = am
             
             # Host Persistence (Fixes "Vanishing URL" bug)
-            oh = await memory_manager.get_global_setting("ollama_host")
+            oh = values.get("ollama_host")
             if oh and oh.strip():
                 self.ollama.host = oh
                 # Re-init session if needed handled by client, but host property is dynamic if we used config directly
@@ -185,6 +252,7 @@ class Config:
             
             # Note: ollama_client properties are tied to this config instance
             
+            self._settings_version = version
             logger.info(f"Config Refreshed: Host={self.ollama.host}, Model={self.ollama.model}, Discord={self.discord.enabled}, Telegram={self.telegram.enabled}")
         except Exception as e:
             logger.error(f"Error refreshing config from DB: {e}")
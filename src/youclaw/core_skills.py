@@ -4,63 +4,189 @@ A collection of built-in tools for the bot.
 """
 
 import os
+import io
+import re
+import signal
+import asyncio
+import hashlib
+import py_compile
 import subprocess
 import logging
+import threading
+import time
 import imaplib
 import smtplib
-import email
 from email.message import EmailMessage
+from email.parser import BytesHeaderParser
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from .config import config
 from .skills_manager import skill_manager
 from .scheduler_manager import scheduler_manager
 from .search_client import search_client
+# memory_manager stays a function-local import: memory_manager -> vector_manager ->
+# ollama_client -> core_skills is a cycle, so importing it here fails at startup
 
 logger = logging.getLogger(__name__)
 
-@skill_manager.skill(name="list_emails", description="Check for unread emails in your inbox.")
-def list_emails(limit: int = 5) -> str:
-    """Connects to the IMAP server and retrieves a summary of the latest unread emails."""
-    if not config.email.enabled:
-        return "Email protocol is currently deactivated. Please enable it in the Control Center."
-    
+_READ_FILE_MAX_BYTES = 1 << 20  # 1MB
+_SHELL_MAX_OUTPUT = 64 * 1024  # Per stream; a chatty command can't balloon the bot's memory
+_SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')  # Characters stripped from synthesized skill names
+
+# Authenticated mail sessions kept alive between skill calls, keyed on
+# (host, port, user) -> (connection, last_used). imaplib/smtplib objects are not
+# thread-safe, so each pool is only touched while holding its lock.
+_MAIL_IDLE_TTL = 300  # Seconds of idleness before a session is re-handshaked
+_imap_pool: Dict[tuple, tuple] = {}
+_smtp_pool: Dict[tuple, tuple] = {}
+_imap_lock = threading.Lock()
+_smtp_lock = threading.Lock()
+_header_parser = BytesHeaderParser()  # Header-only parsing; bodies are never fetched
+
+
+def _imap_key() -> tuple:
+    return (config.email.imap_host, config.email.imap_port, config.email.user)
+
+
+def _smtp_key() -> tuple:
+    return (config.email.smtp_host, config.email.smtp_port, config.email.user)
+
+
+def _close_quietly(close) -> None:
+    """Best-effort logout()/quit() of a pooled session we're discarding"""
     try:
-        # Connect to IMAP
+        close()
+    except Exception:
+        pass
+
+
+def _get_imap() -> imaplib.IMAP4_SSL:
+    """Pooled, logged-in IMAP session (caller must hold _imap_lock)"""
+    key = _imap_key()
+    # Host/user changed in the vault: log the old session out instead of leaking its socket
+    for stale in [k for k in _imap_pool if k != key]:
+        _close_quietly(_imap_pool.pop(stale)[0].logout)
+    mail, last_used = _imap_pool.pop(key, (None, 0.0))
+    now = time.monotonic()
+    if mail is not None:
+        try:
+            if now - last_used > _MAIL_IDLE_TTL:
+                mail.logout()
+                mail = None
+            else:
+                mail.noop()  # Cheap liveness probe; raises if the server dropped us
+        except (imaplib.IMAP4.error, OSError):
+            mail = None
+    if mail is None:
         mail = imaplib.IMAP4_SSL(config.email.imap_host, config.email.imap_port)
         mail.login(config.email.user, config.email.password)
-        mail.select("inbox")
-        
-        # Search for unread emails
-        status, messages = mail.search(None, 'UNSEEN')
-        if status != 'OK':
-            return "Failed to search neural streams for messages."
+        # Servers often advertise more (e.g. SORT) once authenticated; imaplib only asked pre-login
+        status, caps = mail.capability()
+        if status == 'OK' and caps and caps[0]:
+            mail.capabilities = tuple(caps[0].decode('ascii', 'ignore').upper().split())
+    _imap_pool[key] = (mail, now)
+    return mail
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """Pooled, authenticated SMTP session (caller must hold _smtp_lock)"""
+    key = _smtp_key()
+    for stale in [k for k in _smtp_pool if k != key]:
+        _close_quietly(_smtp_pool.pop(stale)[0].quit)
+    server, last_used = _smtp_pool.pop(key, (None, 0.0))
+    now = time.monotonic()
+    if server is not None:
+        try:
+            if now - last_used > _MAIL_IDLE_TTL:
+                server.quit()
+                server = None
+            elif server.noop()[0] != 250:
+                server = None
+        except (smtplib.SMTPException, OSError):
+            server = None
+    if server is None:
+        server = smtplib.SMTP(config.email.smtp_host, config.email.smtp_port)
+        server.starttls()
+        server.login(config.email.user, config.email.password)
+    _smtp_pool[key] = (server, now)
+    return server
+
+def _fetch_unread_summary(limit: int) -> str:
+    """Blocking IMAP work for list_emails; runs in a worker thread"""
+    limit = max(1, limit)  # An empty FETCH set is a protocol error on the server
+    with _imap_lock:
+        try:
+            # Reuse the pooled IMAP session
+            mail = _get_imap()
+            mail.select("inbox")
             
-        email_ids = messages[0].split()
-        if not email_ids:
-            return "No unread messages found in your neural inbox."
+            # Search for unread emails, newest first; let the server order them when it can
+            server_sorted = 'SORT' in mail.capabilities
+            if server_sorted:
+                status, messages = mail.sort('(REVERSE DATE)', 'UTF-8', 'UNSEEN')
+            else:
+                status, messages = mail.search(None, 'UNSEEN')
+            if status != 'OK':
+                return "Failed to search neural streams for messages."
+                
+            email_ids = messages[0].split()
+            if not email_ids:
+                return "No unread messages found in your neural inbox."
             
-        results = []
-        # Get the latest 'limit' emails
-        for e_id in reversed(email_ids[-limit:]):
-            status, msg_data = mail.fetch(e_id, '(RFC822)')
+            # SEARCH returns ascending sequence numbers, so take its tail reversed
+            latest = email_ids[:limit] if server_sorted else email_ids[:-limit - 1:-1]
+                
+            # Fetch the latest 'limit' headers in one round-trip; PEEK leaves them unread
+            id_set = b','.join(latest)
+            status, msg_data = mail.fetch(id_set, '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])')
+            if status != 'OK':
+                return "Failed to retrieve message headers from the neural inbox."
+            
+            headers = {}
             for response_part in msg_data:
                 if isinstance(response_part, tuple):
-                    msg = email.message_from_bytes(response_part[1])
-                    subject = msg["subject"]
-                    sender = msg["from"]
-                    results.append(f"FROM: {sender}\nSUBJECT: {subject}")
-        
-        mail.logout()
-        summary = "\n\n".join(results)
-        return f"Found {len(email_ids)} unread messages. Here are the latest {len(results)}:\n\n{summary}"
-        
+                    seq = int(response_part[0].split(None, 1)[0])
+                    headers[seq] = _header_parser.parsebytes(response_part[1])
+            
+        except Exception:
+            _imap_pool.pop(_imap_key(), None)  # Don't hand a broken session to the next call
+            raise
+    
+    # Write the summary straight into one buffer instead of a per-message f-string + join
+    buf = io.StringIO()
+    write = buf.write
+    # FETCH answers in mailbox order, so emit in the order we picked the ids
+    for i, msg in enumerate(headers[int(seq)] for seq in latest if int(seq) in headers):
+        if i:
+            write("\n\n")
+        write("FROM: "); write(str(msg['from']))
+        write("\nSUBJECT: "); write(str(msg['subject']))
+    return f"Found {len(email_ids)} unread messages. Here are the latest {len(headers)}:\n\n{buf.getvalue()}"
+
+@skill_manager.skill(name="list_emails", description="Check for unread emails in your inbox.")
+async def list_emails(limit: int = 5) -> str:
+    """Connects to the IMAP server and retrieves a summary of the latest unread emails."""
+    if not config.email.enabled:
+        return "Email protocol is currently deactivated. Please enable it in the Control Center."
+    
+    try:
+        # imaplib blocks; keep the event loop free for the chat platforms
+        return await asyncio.to_thread(_fetch_unread_summary, limit)
     except Exception as e:
         logger.error(f"IMAP Error: {e}")
         return f"Protocol Fault during IMAP handshake: {str(e)}"
 
+def _transmit(msg: EmailMessage) -> None:
+    """Blocking SMTP work for send_email; runs in a worker thread"""
+    with _smtp_lock:
+        try:
+            _get_smtp().send_message(msg)
+        except Exception:
+            _smtp_pool.pop(_smtp_key(), None)  # Don't hand a broken session to the next call
+            raise
+
 @skill_manager.skill(name="send_email", description="Send an email to a specific recipient.", risk_level="HIGH")
-def send_email(to_address: str, subject: str, body: str) -> str:
+async def send_email(to_address: str, subject: str, body: str) -> str:
     """Connects to the SMTP server and transmits a new email message."""
     if not config.email.enabled:
         return "Email protocol is currently deactivated. Please enable it in the Control Center."
@@ -72,11 +198,8 @@ def send_email(to_address: str, subject: str, body: str) -> str:
         msg['From'] = config.email.user
         msg['To'] = to_address
         
-        # Connect to SMTP
-        with smtplib.SMTP(config.email.smtp_host, config.email.smtp_port) as server:
-            server.starttls()
-            server.login(config.email.user, config.email.password)
-            server.send_message(msg)
+        # smtplib blocks; send over the pooled session from a worker thread
+        await asyncio.to_thread(_transmit, msg)
             
         return f"Message successfully transmitted to {to_address}."
     except Exception as e:
@@ -92,36 +215,62 @@ async def search_internet(query: str) -> str:
 def read_file(file_path: str) -> str:
     """Reads a file and returns its content. Use this to examine logs, configs, or data files."""
     try:
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return f"Error: File '{file_path}' does not exist."
         
         # Limit file size for safety (1MB)
-        if os.path.getsize(file_path) > 1024 * 1024:
+        if st.st_size > _READ_FILE_MAX_BYTES:
             return "Error: File is too large to read (max 1MB)."
             
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
+            return f.read(_READ_FILE_MAX_BYTES)  # Cap again in case the file grew after stat()
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
+async def _read_capped(stream: asyncio.StreamReader) -> str:
+    """Drain a subprocess pipe, keeping at most _SHELL_MAX_OUTPUT bytes"""
+    buf = bytearray()
+    truncated = False
+    while chunk := await stream.read(65536):
+        room = _SHELL_MAX_OUTPUT - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+        truncated = truncated or len(chunk) > room  # Keep draining so the child never blocks on a full pipe
+    text = buf.decode('utf-8', errors='replace')
+    return text + "\n...[truncated]" if truncated else text
+
 @skill_manager.skill(name="shell_command", description="DANGEROUS: Execute a bash command on the server.", admin_only=True, risk_level="HIGH")
-def shell_command(command: str) -> str:
+async def shell_command(command: str) -> str:
     """Executes a system command and returns the output (stdout and stderr)."""
     try:
         logger.warning(f"Executing shell command: {command}")
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=10
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True  # Own process group, so a timeout can take down the whole pipeline
         )
-        output = result.stdout
-        if result.stderr:
-            output += f"\nErrors:\n{result.stderr}"
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(_read_capped(proc.stdout), _read_capped(proc.stderr), proc.wait()),
+                timeout=10
+            )
+        except asyncio.TimeoutError:
+            if hasattr(os, "killpg"):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+            await proc.wait()
+            return "Error: Command timed out after 10 seconds."
+        output = stdout
+        if stderr:
+            output += f"\nErrors:\n{stderr}"
         return output or "Command executed successfully (no output)."
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out after 10 seconds."
     except Exception as e:
         return f"Error executing command: {str(e)}"
 
@@ -153,19 +302,16 @@ async def store_secret(key: str, value: str, platform: str, user_id: str) -> str
 def run_python_code(code: str) -> str:
     """Executes Python code and returns the result of the last expression or printed output."""
     try:
-        # Create a temporary script to run
-        with open('temp_script.py', 'w') as f:
-            f.write(code)
-        
+        # Pipe the code over stdin: no temp file to write, clean up or race on.
+        # Not isolated (-I): sys.path[0] stays '' so user site-packages and local modules import.
         result = subprocess.run(
-            ['python3', 'temp_script.py'],
+            ['python3', '-'],
+            input=code,
             capture_output=True,
             text=True,
             timeout=15
         )
         
-        os.remove('temp_script.py')
-        
         output = result.stdout
         if result.stderr:
             output += f"\nErrors:\n{result.stderr}"
@@ -177,8 +323,7 @@ def synthesize_new_skill(skill_name: str, description: str, code: str) -> str:
     """Save the code to dynamic_skills/ folder so it can be used in future conversations."""
     try:
         # Sanitize skill name
-        import re
-        safe_name = re.sub(r'[^a-zA-Z0-9_]', '', skill_name).lower()
+        safe_name = _SAFE_NAME_RE.sub('', skill_name).lower()
         if not safe_name:
             return "Error: Invalid skill name."
             
@@ -197,6 +342,13 @@ def synthesize_new_skill(skill_name: str, description: str, code: str) -> str:
         with open(file_path, 'w') as f:
             f.write(module_content)
         
+        # Write the __pycache__ bytecode now so the next startup's import skips compilation
+        try:
+            py_compile.compile(file_path, doraise=True)
+        except py_compile.PyCompileError as e:
+            os.remove(file_path)  # Don't leave a module behind that would fail every load
+            return f"Error synthesizing skill: generated code does not compile: {e.msg}"
+        
         return f"Successfully synthesized new skill: {safe_name}. I can now use it in future tasks!"
     except Exception as e:
         return f"Error synthesizing skill: {str(e)}"
@@ -204,7 +356,9 @@ def synthesize_new_skill(skill_name: str, description: str, code: str) -> str:
 @skill_manager.skill(name="watch_url", description="Set up a watchdog to monitor a URL for changes or status. The bot will alert you if the status changes.")
 async def watch_url(url: str, interval_minutes: int, platform: str, user_id: str) -> str:
     """Useful for monitoring websites, servers, or APIs. Example: 'Watch https://google.com every 5 minutes'."""
-    job_id = f"watch_{user_id}_{hash(url)}"
+    # hash() is salted per process, so use a stable digest to dedupe the job across restarts
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+    job_id = f"watch_{user_id}_{digest}"
     await scheduler_manager.add_watcher_job(
         platform=platform,
         user_id=user_id,
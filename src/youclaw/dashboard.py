@@ -6,9 +6,15 @@ Web interface for monitoring and managing YouClaw.
 from aiohttp import web
 import aiohttp_jinja2
 import jinja2
-import json
+import orjson
 import asyncio
+import gzip
+import zlib
+import hashlib
+import hmac
 import os
+import re
+import time
 from pathlib import Path
 from datetime import datetime
 from .ollama_client import ollama_client
@@ -16,6 +22,7 @@ from .memory_manager import memory_manager
 from .skills_manager import skill_manager
 from .scheduler_manager import scheduler_manager
 from .env_manager import env_manager
+from .personality_manager import PERSONALITIES, DEFAULT_PERSONALITY
 
 from .config import config
 import logging
@@ -25,33 +32,121 @@ logger = logging.getLogger(__name__)
 # Dashboard routes
 routes = web.RouteTableDef()
 
+# Display name per personality key, resolved once instead of per /api/stats call
+_PERSONALITY_NAMES = {key: p['name'] for key, p in PERSONALITIES.items()}
+_DEFAULT_PERSONALITY_NAME = _PERSONALITY_NAMES[DEFAULT_PERSONALITY]
+
+
+def _json_response(data, status=200, headers=None):
+    """web.json_response equivalent that encodes with orjson"""
+    return web.Response(
+        body=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        content_type='application/json',
+        headers=headers
+    )
+
+
+def _etag_json_response(request, data):
+    """JSON response fingerprinted with an ETag; bodyless 304 when the client already has it"""
+    body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if request.headers.get('If-None-Match') == etag:
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type='application/json', headers=headers)
+
+
+# Fixed SQL for the hot dashboard queries. Always passing the same text lets
+# sqlite3's per-connection statement cache hand back the already-prepared statement.
+_SQL_USER_AUTH = "SELECT password_hash, role FROM users WHERE username = ?"
+# (global count, distinct users) in a single round-trip
+_SQL_STATS_COUNTS = """
+    SELECT (SELECT COUNT(*) FROM conversations),
+           (SELECT COUNT(DISTINCT user_id) FROM conversations)
+"""
+_SQL_RECENT_CONVS = """
+    SELECT platform, user_id, channel_id, 
+           MAX(timestamp) as last_message,
+           COUNT(*) as message_count
+    FROM conversations
+    WHERE platform=? AND user_id=?
+    GROUP BY channel_id
+    ORDER BY last_message DESC
+    LIMIT 50
+"""
+_SQL_CLEAR_MEM = "DELETE FROM conversations WHERE platform=? AND user_id=?"
+
+# username -> (expires_at, expected token bytes, role) for verify_session
+_SESSION_TTL = 60.0
+_session_cache = {}
+
+# Global conversation counts are full-table scans; reuse them for a few seconds
+# unless memory_manager has written to conversations since they were taken
+_STATS_TTL = 5.0
+_stats_cache = {"ts": 0.0, "writes": -1, "total": 0, "uniq": 0}
+
+# Whole /api/stats responses per (platform, user_id, is_admin) -> (expires_at, body, etag),
+# so tabs polling every second share one build and revalidate with If-None-Match
+_STATS_SNAPSHOT_TTL = 2.0
+_STATS_CACHE_CONTROL = 'private, max-age=2'
+_stats_snapshots = {}
+
+# /api/events re-checks state this often and sends a comment frame after this
+# much silence so proxies don't reap the idle connection
+_EVENTS_INTERVAL = 5.0
+_EVENTS_KEEPALIVE = 15.0
+
 async def verify_session(request):
     """Verify X-Session-Token against stored credentials"""
     username = request.headers.get('X-Session-User')
     token = request.headers.get('X-Session-Token')
     if not username or not token: return None
     
-    async with memory_manager.db.execute("SELECT password_hash, role FROM users WHERE username = ?", (username,)) as cursor:
-        row = await cursor.fetchone()
-        if row:
-            pw_hash, role = row
-            import hashlib
-            from .config import config
-            expected_token = hashlib.sha256(f"{username}{pw_hash}{config.bot.prefix}".encode()).hexdigest()
-            if token == expected_token:
-                return {"username": username, "role": role}
+    # Expected tokens are cached per user so the hot auth path skips SQLite
+    now = time.monotonic()
+    cached = _session_cache.get(username)
+    if cached is None or cached[0] <= now:
+        async with memory_manager.db_ro.execute(_SQL_USER_AUTH, (username,)) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            _session_cache.pop(username, None)
+            return None
+        pw_hash, role = row
+        expected_token = hashlib.sha256(f"{username}{pw_hash}{config.bot.prefix}".encode()).hexdigest()
+        cached = (now + _SESSION_TTL, expected_token.encode(), role)
+        _session_cache[username] = cached
+    
+    _, expected_token, role = cached
+    # Constant-time compare so response timing doesn't leak how much of the token matched
+    if hmac.compare_digest(token.encode(), expected_token):
+        return {"username": username, "role": role}
     return None
 
+async def resolve_session(request):
+    """Authenticate once per request -> (auth, platform, user_id, is_admin)"""
+    session = request.get('_session')
+    if session is None:
+        auth = await verify_session(request)
+        platform, user_id = None, None
+        if auth:
+            platform, user_id = await memory_manager.get_linked_identity(auth['username'])
+        # Universal Admin: If you can login, you are the owner.
+        session = (auth, platform, user_id, auth is not None)
+        request['_session'] = session
+    return session
+
 async def get_user_identity(request):
     """Get the linked platform:id for the current session user + token verification"""
-    auth = await verify_session(request)
-    if not auth: return None, None
-    
-    platform, user_id = await memory_manager.get_linked_identity(auth['username'])
+    _, platform, user_id, _ = await resolve_session(request)
     return platform, user_id
 
 async def check_admin(request):
     """Check if the session user is an admin + token verification"""
+    session = request.get('_session')
+    if session is not None:
+        return session[3]
+    # Admin-only endpoints don't need the linked identity, just the token check
     auth = await verify_session(request)
     # Universal Admin: If you can login, you are the owner.
     return auth is not None
@@ -59,11 +154,37 @@ async def check_admin(request):
 
 @routes.get('/')
 async def serve_html(request):
-    return web.Response(
-        text=DASHBOARD_HTML, 
-        content_type='text/html',
-        headers={'Cache-Control': 'no-store, no-cache, must-revalidate, max-age=0'}
-    )
+    # Revalidate every load, but let an unchanged page come back as a bodyless 304
+    headers = {'Cache-Control': 'no-cache', 'ETag': _HTML_ETAG, 'Vary': 'Accept-Encoding'}
+    if request.headers.get('If-None-Match') == _HTML_ETAG:
+        return web.Response(status=304, headers=headers)
+    parts = _HTML_UTF8_PARTS
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        parts = _HTML_GZ_PARTS
+    # Send <head> (stylesheet + script tags) as its own write so the browser can
+    # start on the CSSOM and subresources while the body is still in flight
+    response = web.StreamResponse(headers=headers)
+    response.content_type = 'text/html'
+    response.charset = 'utf-8'
+    response.content_length = len(parts[0]) + len(parts[1])
+    await response.prepare(request)
+    for part in parts:
+        await response.write(part)
+    await response.write_eof()
+    return response
+
+
+@routes.get('/static/dashboard.{digest}.css')
+async def serve_css(request):
+    # Hashed URL: immutable, so repeat visits never even revalidate
+    if request.match_info['digest'] != _CSS_HASH:
+        raise web.HTTPNotFound()
+    headers = {'Cache-Control': 'public, max-age=31536000, immutable', 'Vary': 'Accept-Encoding'}
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        return web.Response(body=_CSS_GZ, content_type='text/css', charset='utf-8', headers=headers)
+    return web.Response(body=_CSS_BYTES, content_type='text/css', charset='utf-8', headers=headers)
 
 
 @routes.post('/api/auth/register')
@@ -74,14 +195,14 @@ async def api_register(request):
         username = data.get('username')
         password = data.get('password')
         if not username or not password:
-            return web.json_response({"error": "Username and password required"}, status=400)
+            return _json_response({"error": "Username and password required"}, status=400)
         
         success = await memory_manager.create_user(username, password)
         if success:
-            return web.json_response({"success": True})
-        return web.json_response({"error": "Username already exists"}, status=400)
+            return _json_response({"success": True})
+        return _json_response({"error": "Username already exists"}, status=400)
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/auth/login')
@@ -91,10 +212,10 @@ async def api_login(request):
         data = await request.json()
         user = await memory_manager.verify_user(data.get('username'), data.get('password'))
         if user:
-            return web.json_response({"success": True, "user": user})
-        return web.json_response({"error": "Invalid credentials"}, status=401)
+            return _json_response({"success": True, "user": user})
+        return _json_response({"error": "Invalid credentials"}, status=401)
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/auth/link')
@@ -102,94 +223,149 @@ async def api_link_account(request):
     """Link dashboard account to bot platform identity"""
     try:
         username = request.headers.get('X-Session-User')
-        if not username: return web.json_response({"error": "Auth Required"}, status=401)
+        if not username: return _json_response({"error": "Auth Required"}, status=401)
         
         data = await request.json()
         platform = data.get('platform')
         user_id = data.get('user_id')
         
         if not platform or not user_id:
-            return web.json_response({"error": "Platform and ID required"}, status=400)
+            return _json_response({"error": "Platform and ID required"}, status=400)
             
         await memory_manager.link_account(username, platform, user_id)
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
+
+
+async def _conversation_counts(now):
+    """(total messages, unique users) for api_stats"""
+    if now - _stats_cache["ts"] < _STATS_TTL and _stats_cache["writes"] == memory_manager.conversation_writes:
+        return _stats_cache["total"], _stats_cache["uniq"]
+    
+    writes = memory_manager.conversation_writes  # Snapshot before the await
+    # Global stats in one query; the dashboard shows the global total, not a per-user count
+    async with memory_manager.db_ro.execute(_SQL_STATS_COUNTS) as cursor:
+        total_messages, unique_users = await cursor.fetchone()
+    _stats_cache.update(ts=now, writes=writes, total=total_messages, uniq=unique_users)
+    return total_messages, unique_users
+
+async def _ollama_health():
+    try:
+        # Force 2-second timeout for dashboard responsiveness
+        return await asyncio.wait_for(ollama_client.check_health(), timeout=2.0)
+    except:
+        return False
+
+async def _available_models():
+    try:
+        return await ollama_client.get_available_models()
+    except:
+        return []
+
+
+async def _stats_snapshot(platform, user_id, is_admin):
+    """(body, etag) of the stats payload for one viewer, rebuilt at most every _STATS_SNAPSHOT_TTL"""
+    now = time.monotonic()
+    snap_key = (platform, user_id, is_admin)
+    snap = _stats_snapshots.get(snap_key)
+    if snap and snap[0] > now:
+        return snap[1], snap[2]
+    
+    # Calculate uptime (simplified to avoid psutil issues)
+    try:
+        # Just show process start time relative to now if possible, 
+        # but without psutil we can't easily get start time cross-platform.
+        # We will skip uptime or assume 0 for stability.
+        uptime_str = "Running"
+    except:
+        uptime_str = "Unknown"
+
+    # DB lookups and the Ollama round-trips are independent: overlap them
+    pending = [
+        _conversation_counts(now),
+        memory_manager.get_global_setting("active_personality", DEFAULT_PERSONALITY),
+        _ollama_health(),
+    ]
+    if is_admin:
+        pending.append(_available_models())
+    results = await asyncio.gather(*pending)
+    (total_messages, unique_users), active_p, ollama_health = results[:3]
+    personality_name = _PERSONALITY_NAMES.get(active_p, _DEFAULT_PERSONALITY_NAME)
+    
+    stats = {
+        "version": "4.9.10",
+        "status": "online",
+        "uptime": uptime_str,
+        "ollama_connected": ollama_health,
+        "ollama_model": ollama_client.model if ollama_health else "Disconnected (Check URL)",
+        "telegram_enabled": config.telegram.enabled,
+        "discord_enabled": config.discord.enabled,
+        "timestamp": datetime.now().isoformat(),
+        "user_messages": total_messages,
+        "unique_users": unique_users,
+        "active_personality": personality_name,
+        "user_identity": f"{platform}:{user_id}" if user_id else "Guest",
+        "is_linked": bool(user_id),
+        "model": ollama_client.model if ollama_health else "Disconnected",
+        "is_admin": is_admin
+    }
+    
+    if is_admin:
+        stats["available_models"] = results[3]
+    
+    body = orjson.dumps(stats, option=orjson.OPT_NON_STR_KEYS)
+    # The timestamp changes on every build; fingerprint everything else so an
+    # unchanged state keeps its (weak) ETag across rebuilds
+    stable = orjson.dumps({k: v for k, v in stats.items() if k != "timestamp"}, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'W/"{hashlib.blake2b(stable, digest_size=8).hexdigest()}"'
+    # Drop expired snapshots so the map only holds recently active viewers
+    for key in [k for k, v in _stats_snapshots.items() if v[0] <= now]:
+        del _stats_snapshots[key]
+    _stats_snapshots[snap_key] = (now + _STATS_SNAPSHOT_TTL, body, etag)
+    return body, etag
+
+def _jobs_payload(platform, user_id):
+    """Jobs belonging to one linked identity, soonest first"""
+    jobs = []
+    if user_id:
+        for job in scheduler_manager.jobs_for(platform, user_id):
+            jobs.append({
+                "id": job.id,
+                "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
+                "prompt": job.args[2] if len(job.args) > 2 else "Mission"
+            })
+    return {"jobs": jobs}
+
+async def _conversations_payload(platform, user_id):
+    """Most recent threads for one linked identity"""
+    if not user_id: return {"conversations": []}
+    async with memory_manager.db_ro.execute(_SQL_RECENT_CONVS, (platform, user_id)) as cursor:
+        # Consume rows straight off the cursor (no fetchall() copy)
+        conversations = [
+            {"platform": r[0], "user_id": r[1], "channel_id": r[2], "last_message": r[3], "message_count": r[4]}
+            async for r in cursor
+        ]
+    return {"conversations": conversations}
 
 
 @routes.get('/api/stats')
 async def api_stats(request):
     """Get bot statistics for current user"""
     try:
-        platform, user_id = await get_user_identity(request)
-        is_admin = await check_admin(request)
+        _, platform, user_id, is_admin = await resolve_session(request)
         
         if not user_id and not is_admin:
-            return web.json_response({"error": "Account not linked to a bot platform"}, status=403)
-        
-        # Get memory stats for this user if linked
-        count = 0
-        if user_id:
-            async with memory_manager.db.execute(
-                "SELECT COUNT(*) FROM conversations WHERE platform=? AND user_id=?", 
-                (platform, user_id)
-            ) as cursor:
-                count = (await cursor.fetchone())[0]
-            
-        # Get global stats
-        async with memory_manager.db.execute("SELECT COUNT(*) FROM conversations") as cursor:
-            total_messages = (await cursor.fetchone())[0]
-        async with memory_manager.db.execute("SELECT COUNT(DISTINCT user_id) FROM conversations") as cursor:
-            unique_users = (await cursor.fetchone())[0]
-            
-        # Calculate uptime (simplified to avoid psutil issues)
-        import time, os
-        try:
-            # Just show process start time relative to now if possible, 
-            # but without psutil we can't easily get start time cross-platform.
-            # We will skip uptime or assume 0 for stability.
-            uptime_str = "Running"
-        except:
-            uptime_str = "Unknown"
-
-        from .personality_manager import PERSONALITIES, DEFAULT_PERSONALITY
-        active_p = await memory_manager.get_global_setting("active_personality", DEFAULT_PERSONALITY)
-        personality_name = PERSONALITIES.get(active_p, PERSONALITIES[DEFAULT_PERSONALITY])['name']
+            return _json_response({"error": "Account not linked to a bot platform"}, status=403)
         
-        try:
-            import asyncio
-            # Force 3-second timeout for dashboard responsiveness
-            ollama_health = await asyncio.wait_for(ollama_client.check_health(), timeout=2.0)
-        except:
-            ollama_health = False
-        
-        stats = {
-            "version": "4.9.10",
-            "status": "online",
-            "uptime": uptime_str,
-            "ollama_connected": ollama_health,
-            "ollama_model": ollama_client.model if ollama_health else "Disconnected (Check URL)",
-            "telegram_enabled": config.telegram.enabled,
-            "discord_enabled": config.discord.enabled,
-            "timestamp": datetime.now().isoformat(),
-            "user_messages": total_messages,
-            "unique_users": unique_users,
-            "active_personality": personality_name,
-            "user_identity": f"{platform}:{user_id}" if user_id else "Guest",
-            "is_linked": bool(user_id),
-            "model": ollama_client.model if ollama_health else "Disconnected",
-            "is_admin": is_admin
-        }
-        
-        if is_admin:
-            try:
-                stats["available_models"] = await ollama_client.get_available_models()
-            except:
-                stats["available_models"] = []
-            
-        return web.json_response(stats)
+        # Serve the recent snapshot for this viewer; 304 if the browser already has it
+        body, etag = await _stats_snapshot(platform, user_id, is_admin)
+        headers = {'ETag': etag, 'Cache-Control': _STATS_CACHE_CONTROL}
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type='application/json', headers=headers)
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.get('/api/conversations')
@@ -197,30 +373,67 @@ async def api_conversations(request):
     """Get recent conversations for current user"""
     try:
         platform, user_id = await get_user_identity(request)
-        if not user_id: return web.json_response({"conversations": []})
-
-        async with memory_manager.db.execute("""
-            SELECT platform, user_id, channel_id, 
-                   MAX(timestamp) as last_message,
-                   COUNT(*) as message_count
-            FROM conversations
-            WHERE platform=? AND user_id=?
-            GROUP BY channel_id
-            ORDER BY last_message DESC
-            LIMIT 50
-        """, (platform, user_id)) as cursor:
-            rows = await cursor.fetchall()
-            conversations = [{"platform": r[0], "user_id": r[1], "channel_id": r[2], "last_message": r[3], "message_count": r[4]} for r in rows]
-            return web.json_response({"conversations": conversations})
+        return _etag_json_response(request, await _conversations_payload(platform, user_id))
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
+
+
+@routes.get('/api/events')
+async def api_events(request):
+    """Server-Sent Events: push stats/jobs/conversations to the dashboard only when they change"""
+    _, platform, user_id, is_admin = await resolve_session(request)
+    if not is_admin:
+        return _json_response({"error": "Unauthorized"}, status=401)
+    
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    await response.prepare(request)
+    
+    # Every event carries a full snapshot, so a reconnect (Last-Event-ID or not)
+    # just starts from the current state instead of replaying missed deltas
+    last_sent = {}
+    convs_writes = -1
+    event_id = 0
+    quiet = 0.0
+    try:
+        while await verify_session(request):  # Logout/password change ends the stream
+            stats_body, stats_tag = await _stats_snapshot(platform, user_id, is_admin)
+            pending = [("stats", stats_tag, stats_body)]
+            jobs_body = orjson.dumps(_jobs_payload(platform, user_id))
+            pending.append(("jobs", jobs_body, jobs_body))
+            # Only re-run the conversations query when something was written
+            if convs_writes != memory_manager.conversation_writes:
+                convs_writes = memory_manager.conversation_writes
+                convs_body = orjson.dumps(await _conversations_payload(platform, user_id))
+                pending.append(("conversations", convs_body, convs_body))
+            
+            out = bytearray()
+            for name, key, body in pending:
+                if last_sent.get(name) != key:
+                    last_sent[name] = key
+                    event_id += 1
+                    out += b'event: %b\nid: %d\ndata: %b\n\n' % (name.encode(), event_id, body)
+            if out:
+                await response.write(out)
+                quiet = 0.0
+            elif quiet >= _EVENTS_KEEPALIVE:
+                await response.write(b': keepalive\n\n')
+                quiet = 0.0
+            await asyncio.sleep(_EVENTS_INTERVAL)
+            quiet += _EVENTS_INTERVAL
+    except ConnectionResetError:
+        pass  # Tab closed
+    return response
 
 
 @routes.get('/api/skills')
 async def api_skills(request):
     """Get available skills"""
     skills = skill_manager.get_all_skills()
-    return web.json_response({"skills": skills})
+    return _json_response({"skills": skills})
 
 
 @routes.get('/api/jobs')
@@ -228,19 +441,9 @@ async def api_get_jobs(request):
     """Get jobs belonging to the current user"""
     try:
         platform, user_id = await get_user_identity(request)
-        if not user_id: return web.json_response({"jobs": []})
-        
-        jobs = []
-        for job in scheduler_manager.scheduler.get_jobs():
-            if len(job.args) >= 2 and job.args[0] == platform and job.args[1] == user_id:
-                jobs.append({
-                    "id": job.id,
-                    "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
-                    "prompt": job.args[2] if len(job.args) > 2 else "Mission"
-                })
-        return web.json_response({"jobs": jobs})
+        return _etag_json_response(request, _jobs_payload(platform, user_id))
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/jobs/schedule')
@@ -248,7 +451,7 @@ async def api_schedule_job(request):
     """Schedule a new AI Cron Job for the current user"""
     try:
         req_platform, req_user_id = await get_user_identity(request)
-        if not req_user_id: return web.json_response({"error": "Account linking required"}, status=403)
+        if not req_user_id: return _json_response({"error": "Account linking required"}, status=403)
         
         data = await request.json()
         prompt = data.get('prompt')
@@ -257,16 +460,15 @@ async def api_schedule_job(request):
         realtime = data.get('realtime', True)
         
         if not prompt:
-            return web.json_response({"error": "Prompt required"}, status=400)
+            return _json_response({"error": "Prompt required"}, status=400)
         
-        import hashlib
-        job_id = f"cron_{hashlib.md5(f'{req_user_id}{prompt}{channel}'.encode()).hexdigest()[:8]}"
+        job_id = f"cron_{hashlib.blake2b(f'{req_user_id}{prompt}{channel}'.encode(), digest_size=4).hexdigest()}"
         cron_expr = f"*/{frequency} * * * *" if int(frequency) < 60 else f"0 */{int(int(frequency)/60)} * * *"
         
         await scheduler_manager.add_ai_cron_job(channel, req_user_id, prompt, cron_expr, job_id, realtime=realtime)
-        return web.json_response({"success": True, "job_id": job_id})
+        return _json_response({"success": True, "job_id": job_id})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/jobs/delete')
@@ -277,21 +479,19 @@ async def api_delete_job(request):
         data = await request.json()
         job_id = data.get('job_id')
         
-        job = scheduler_manager.scheduler.get_job(job_id)
-        if job and len(job.args) >= 2 and job.args[0] == platform and job.args[1] == user_id:
+        if user_id and scheduler_manager.owns_job(platform, user_id, job_id):
             scheduler_manager.scheduler.remove_job(job_id)
-            return web.json_response({"success": True})
-        return web.json_response({"error": "Unauthorized or not found"}, status=403)
+            return _json_response({"success": True})
+        return _json_response({"error": "Unauthorized or not found"}, status=403)
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.get('/api/system/personality')
 async def api_get_personality(request):
     """Get list of personalities and current active one"""
-    from .personality_manager import PERSONALITIES, DEFAULT_PERSONALITY
     active = await memory_manager.get_global_setting("active_personality", DEFAULT_PERSONALITY)
-    return web.json_response({
+    return _json_response({
         "personalities": PERSONALITIES,
         "active": active
     })
@@ -300,26 +500,25 @@ async def api_get_personality(request):
 @routes.post('/api/system/personality')
 async def api_set_personality(request):
     """Admin Only: Switch personality"""
-    if not await check_admin(request): return web.json_response({"error": "Unauthorized"}, status=403)
+    if not await check_admin(request): return _json_response({"error": "Unauthorized"}, status=403)
     try:
         data = await request.json()
         key = data.get('personality')
-        from .personality_manager import PERSONALITIES
         if key in PERSONALITIES:
             await memory_manager.set_global_setting("active_personality", key)
-            return web.json_response({"success": True})
-        return web.json_response({"error": "Invalid personality"}, status=400)
+            return _json_response({"success": True})
+        return _json_response({"error": "Invalid personality"}, status=400)
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.get('/api/system/env')
 async def api_get_env(request):
     """Admin Only: Get current tokens"""
-    if not await check_admin(request): return web.json_response({"error": "Unauthorized"}, status=403)
+    if not await check_admin(request): return _json_response({"error": "Unauthorized"}, status=403)
     try:
         env_vars = env_manager.get_all()
-        return web.json_response({
+        return _json_response({
             "telegram_token": env_vars.get("TELEGRAM_BOT_TOKEN") or config.telegram.token or "",
             "discord_token": env_vars.get("DISCORD_BOT_TOKEN") or config.discord.token or "",
             "search_url": env_vars.get("SEARCH_ENGINE_URL") or config.search_url,
@@ -334,86 +533,85 @@ async def api_get_env(request):
             }
         })
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/system/secrets')
 async def api_save_system_secrets(request):
     """Admin Only: Update tokens"""
-    if not await check_admin(request): return web.json_response({"error": "Unauthorized"}, status=403)
+    if not await check_admin(request): return _json_response({"error": "Unauthorized"}, status=403)
     try:
         data = await request.json()
+        # Collect every DB write first so they land in one transaction (one commit/fsync)
+        updates = {}
         if 'telegram_token' in data:
             val = data['telegram_token']
             env_manager.set_key("TELEGRAM_BOT_TOKEN", val)
-            await memory_manager.set_global_setting("telegram_token", val)
+            updates["telegram_token"] = val
         if 'discord_token' in data:
             val = data['discord_token']
             env_manager.set_key("DISCORD_BOT_TOKEN", val)
-            await memory_manager.set_global_setting("discord_token", val)
+            updates["discord_token"] = val
         if 'search_url' in data:
             val = data['search_url']
             env_manager.set_key("SEARCH_ENGINE_URL", val)
-            await memory_manager.set_global_setting("search_url", val)
-            
-        ollama_status = "unchanged"
+            updates["search_url"] = val
         if 'ollama_url' in data:
             val = data['ollama_url']
             env_manager.set_key("OLLAMA_HOST", val)
-            await memory_manager.set_global_setting("ollama_host", val)
-            
-            # Instant validation
-            await config.refresh_from_db()
-            await ollama_client.initialize() # Re-init with new URL
-            try:
-                import asyncio
-                is_online = await asyncio.wait_for(ollama_client.check_health(), timeout=2.0)
-                ollama_status = "online" if is_online else "offline"
-            except:
-                ollama_status = "offline"
+            updates["ollama_host"] = val
         
         # Email Secrets
         if 'email' in data:
             e = data['email']
-            if 'imap_host' in e: await memory_manager.set_global_setting("email_imap_host", e['imap_host'])
-            if 'imap_port' in e: await memory_manager.set_global_setting("email_imap_port", str(e['imap_port']))
-            if 'smtp_host' in e: await memory_manager.set_global_setting("email_smtp_host", e['smtp_host'])
-            if 'smtp_port' in e: await memory_manager.set_global_setting("email_smtp_port", str(e['smtp_port']))
-            if 'user' in e: await memory_manager.set_global_setting("email_user", e['user'])
-            if 'password' in e: await memory_manager.set_global_setting("email_password", e['password'])
-
+            if 'imap_host' in e: updates["email_imap_host"] = e['imap_host']
+            if 'imap_port' in e: updates["email_imap_port"] = str(e['imap_port'])
+            if 'smtp_host' in e: updates["email_smtp_host"] = e['smtp_host']
+            if 'smtp_port' in e: updates["email_smtp_port"] = str(e['smtp_port'])
+            if 'user' in e: updates["email_user"] = e['user']
+            if 'password' in e: updates["email_password"] = e['password']
+
+        await memory_manager.set_global_settings(updates)
         await config.refresh_from_db()
+        
+        ollama_status = "unchanged"
+        if 'ollama_url' in data:
+            # Instant validation against the new URL
+            await ollama_client.initialize()
+            try:
+                is_online = await asyncio.wait_for(ollama_client.check_health(), timeout=2.0)
+                ollama_status = "online" if is_online else "offline"
+            except:
+                ollama_status = "offline"
             
         bot_instance = request.app.get('bot')
-        if bot_instance: asyncio.create_task(bot_instance.restart_handlers())
-        bot_instance = request.app.get('bot')
-        if bot_instance: asyncio.create_task(bot_instance.restart_handlers())
-        return web.json_response({"success": True, "ollama_status": ollama_status})
+        if bot_instance: bot_instance.schedule_restart()
+        return _json_response({"success": True, "ollama_status": ollama_status})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/system/toggle_channel')
 async def api_toggle_channel(request):
     """Admin Only: Toggle Telegram/Discord connectivity"""
-    if not await check_admin(request): return web.json_response({"error": "Unauthorized"}, status=403)
+    if not await check_admin(request): return _json_response({"error": "Unauthorized"}, status=403)
     try:
         data = await request.json()
         channel = data.get('channel') 
         enabled = data.get('enabled') 
         
         if channel not in ['telegram', 'discord', 'email']:
-            return web.json_response({"error": "Invalid channel"}, status=400)
+            return _json_response({"error": "Invalid channel"}, status=400)
             
         await memory_manager.set_global_setting(f"{channel}_enabled", "true" if enabled else "false")
         await config.refresh_from_db()
         
         bot_instance = request.app.get('bot')
-        if bot_instance: asyncio.create_task(bot_instance.restart_handlers())
+        if bot_instance: bot_instance.schedule_restart()
         
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/memory/clear')
@@ -421,18 +619,20 @@ async def api_clear_memory(request):
     """User: Clear own memory"""
     try:
         platform, user_id = await get_user_identity(request)
-        if not user_id: return web.json_response({"error": "Linking Required"}, status=403)
+        if not user_id: return _json_response({"error": "Linking Required"}, status=403)
         
-        await memory_manager.db.execute("DELETE FROM conversations WHERE platform=? AND user_id=?", (platform, user_id))
+        await memory_manager.db.execute(_SQL_CLEAR_MEM, (platform, user_id))
         await memory_manager.db.commit()
-        return web.json_response({"success": True, "message": "Personal memory cleared!"})
+        memory_manager.conversation_writes += 1
+        return _json_response({"success": True, "message": "Personal memory cleared!"})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.get('/api/chat/stream')
 async def api_chat_stream(request):
     """Streaming dashboard-to-model chat"""
+    response = None
     try:
         username = request.query.get('user')
         message = request.query.get('message')
@@ -440,11 +640,10 @@ async def api_chat_stream(request):
         
         if not username or not message: return web.Response(text="Error: Missing params", status=400)
         
-        auth = await verify_session(request)
+        auth, platform, user_id, _ = await resolve_session(request)
         if not auth or auth['username'] != username:
             return web.Response(text="Error: Unauthorized session scope", status=403)
         
-        platform, user_id = await memory_manager.get_linked_identity(username)
         ctx = {"platform": platform or "dashboard", "user_id": user_id or f"dash_{username}"}
         history = await memory_manager.get_conversation_history(ctx["platform"], ctx["user_id"])
         
@@ -452,31 +651,58 @@ async def api_chat_stream(request):
         profile = await memory_manager.get_user_profile(ctx["platform"], ctx["user_id"])
         if not profile.get("name"): profile["name"] = username
 
-        response = web.StreamResponse(status=200, reason='OK', headers={'Content-Type': 'text/plain'})
+        response = web.StreamResponse(status=200, reason='OK', headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # Ask nginx-style proxies to flush each frame
+        })
+        response.enable_chunked_encoding()
         await response.prepare(request)
 
-        full_response = ""
+        # Append-only byte buffer: amortized O(1) per chunk instead of str += recopying
+        buf = bytearray()
+        intercepted = False
         # Use ReAct streaming with tools
+        # history is a fresh list we own: append in place rather than copying it
+        history.append({"role": "user", "content": message})
         async for chunk in ollama_client.chat_with_tools_stream(
-            messages=history + [{"role": "user", "content": message}],
+            messages=history,
             user_profile=profile,
             context=ctx
         ):
-            await response.write(chunk.encode())
-            full_response += chunk
-        
-        if "[SECURITY_INTERCEPT]" in full_response:
-             # We don't save the intercept raw string to conversation history 
-             # because it's a protocol internal, but we want the UI to see it.
-             pass
-        else:
-             await memory_manager.add_message(ctx["platform"], ctx["user_id"], "assistant", full_response)
+            if "[SECURITY_INTERCEPT]" in chunk:
+                # Parse Format: [SECURITY_INTERCEPT] ID:{request_id} COMMAND:{name}
+                parts = chunk[chunk.index("[SECURITY_INTERCEPT]"):].split()
+                if len(parts) < 3 or not parts[1].startswith("ID:") or not parts[2].startswith("COMMAND:"):
+                    raise ValueError("Malformed security intercept")
+                intercept = {"id": parts[1][3:], "command": parts[2][8:]}
+                await response.write(b"event: intercept\ndata: " + orjson.dumps(intercept) + b"\n\n")
+                intercepted = True
+                break
+            enc = chunk.encode()
+            # One SSE frame per chunk; embedded newlines become continuation data lines
+            await response.write(b"data: " + enc.replace(b"\n", b"\ndata: ") + b"\n\n")
+            buf += enc
+        await response.write(b"event: done\ndata: end\n\n")
+
+        # We don't save the intercept to conversation history
+        # because it's a protocol internal; the UI got it as its own event.
+        if not intercepted:
+             await memory_manager.add_message(ctx["platform"], ctx["user_id"], "assistant", buf.decode())
              
         await response.write_eof()
         return response
     except Exception as e:
         logger.error(f"Stream Error: {e}")
-        return web.Response(text=f"Protocol Fault: {str(e)}", status=500)
+        if response is None or not response.prepared:
+            return web.Response(text=f"Protocol Fault: {str(e)}", status=500)
+        # Headers are already out: report the fault in-band and end the stream
+        try:
+            await response.write(b"event: error\ndata: " + orjson.dumps(f"Protocol Fault: {e}") + b"\n\n")
+            await response.write_eof()
+        except ConnectionResetError:
+            pass
+        return response
 
 
 @routes.post('/api/security/approve')
@@ -489,28 +715,28 @@ async def api_security_approve(request):
         
         if action == "approve":
             result = await skill_manager.confirm_execution(req_id)
-            return web.json_response({"success": True, "result": result})
+            return _json_response({"success": True, "result": result})
         else:
             if req_id in skill_manager.pending_approvals:
                 del skill_manager.pending_approvals[req_id]
-            return web.json_response({"success": True, "message": "Denied"})
+            return _json_response({"success": True, "message": "Denied"})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 @routes.post('/api/model/switch')
 async def api_switch_model(request):
     """Admin Only: Switch model"""
-    if not await check_admin(request): return web.json_response({"error": "Unauthorized"}, status=403)
+    if not await check_admin(request): return _json_response({"error": "Unauthorized"}, status=403)
     try:
         data = await request.json()
         model_name = data.get('model')
         success = await ollama_client.switch_model(model_name)
         if success:
             await memory_manager.set_global_setting("active_model", model_name)
-        return web.json_response({"success": success})
+        return _json_response({"success": success})
     except Exception as e:
-        return web.json_response({"error": str(e)}, status=500)
+        return _json_response({"error": str(e)}, status=500)
 
 
 DASHBOARD_HTML = """
@@ -522,361 +748,7 @@ DASHBOARD_HTML = """
     <title>YouClaw V4.9.5 | Justice Neural Hub 🦞</title>
     <link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
     <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
-    <style>
-        :root {
-            --bg: #050510;
-            --surface: rgba(17, 24, 39, 0.7);
-            --surface-hover: rgba(31, 41, 55, 0.85);
-            --border: rgba(255, 255, 255, 0.1);
-            --text-main: #ffffff;
-            --text-dim: #94a3b8;
-            --primary: #8b5cf6;
-            --accent: #d946ef;
-            --primary-gradient: linear-gradient(135deg, #6366f1 0%, #a855f7 100%);
-            --glass: blur(30px) saturate(180%);
-            --sidebar-width: 300px;
-            --bubble-user: var(--primary-gradient);
-            --bubble-ai: rgba(255, 255, 255, 0.05);
-            --nav-glow: 0 0 20px rgba(139, 92, 246, 0.4);
-            --primary-glow: rgba(139, 92, 246, 0.3);
-            --secondary: #10b981;
-            --danger: #ef4444;
-            --card-shadow: 0 20px 50px -12px rgba(0, 0, 0, 0.5);
-        }
-
-        [data-theme="light"] {
-            --bg: #f8fafc;
-            --surface: rgba(255, 255, 255, 0.9);
-            --surface-hover: #ffffff;
-            --border: rgba(0, 0, 0, 0.1);
-            --text-main: #0f172a;
-            --text-dim: #64748b;
-            --primary: #6366f1;
-            --accent: #d946ef;
-            --bubble-user: linear-gradient(135deg, #6366f1 0%, #4f46e5 100%);
-            --bubble-ai: #ffffff;
-            --primary-glow: rgba(99, 102, 241, 0.2);
-            --glass: blur(10px);
-            --input-bg: rgba(0, 0, 0, 0.03);
-            --input-area-bg: rgba(0, 0, 0, 0.02);
-        }
-
-        :root {
-            --input-bg: rgba(255, 255, 255, 0.05);
-            --input-area-bg: rgba(0, 0, 0, 0.2);
-        }
-
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Plus Jakarta Sans', sans-serif;
-            background: var(--bg);
-            color: var(--text-main);
-            min-height: 100vh;
-            display: flex;
-            overflow: hidden;
-            transition: all 0.4s ease;
-        }
-
-        .sidebar {
-            width: var(--sidebar-width);
-            height: 100vh;
-            background: var(--surface);
-            backdrop-filter: var(--glass);
-            border-right: 1px solid var(--border);
-            padding: 40px 24px;
-            display: flex;
-            flex-direction: column;
-            gap: 40px;
-            z-index: 100;
-        }
-        .sidebar-logo { font-size: 1.5rem; font-weight: 800; letter-spacing: -1px; margin-bottom: 20px; }
-        .nav-list { list-style: none; display: flex; flex-direction: column; gap: 8px; }
-        .nav-item { 
-            padding: 16px 20px; border-radius: 16px; cursor: pointer; transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            display: flex; align-items: center; gap: 16px; font-weight: 700; color: var(--text-dim);
-            border: 1px solid transparent;
-        }
-        .nav-item i { font-style: normal; font-size: 1.2rem; filter: grayscale(1); transition: 0.3s; }
-        .nav-item:hover { background: var(--border); color: var(--text-main); transform: translateX(5px); }
-        .nav-item:hover i { filter: grayscale(0); transform: scale(1.1); }
-        .nav-item.active { 
-            background: var(--primary); color: white; border-color: rgba(255,255,255,0.1);
-            box-shadow: 0 10px 30px var(--primary-glow); 
-        }
-        .nav-item.active i { filter: grayscale(0); }
-
-        .main-stage {
-            flex: 1;
-            height: 100vh;
-            overflow-y: auto;
-            position: relative;
-            background: radial-gradient(at 0% 0%, var(--primary-glow) 0px, transparent 50%);
-        }
-
-        .container { 
-            max-width: 1400px; margin: 0 auto; padding: 48px; 
-            opacity: 0; transform: translateY(10px); transition: all 0.6s ease; 
-        }
-        .container.active { opacity: 1; transform: translateY(0); }
-
-        .auth-portal {
-            position: fixed; top: 0; left: 0; width: 100%; height: 100%;
-            background: rgba(2, 6, 23, 0.7); backdrop-filter: blur(40px);
-            z-index: 10000; display: flex; align-items: center; justify-content: center;
-        }
-        .auth-card { background: var(--surface); border: 1px solid var(--border); padding: 48px; border-radius: 40px; width: 100%; max-width: 440px; text-align: center; }
-
-        .header-bar {
-            display: flex; justify-content: flex-end; align-items: center; gap: 24px;
-            margin-bottom: 40px; padding: 0 0 20px 0; border-bottom: 1px solid var(--border);
-        }
-
-        .dashboard-grid { display: grid; grid-template-columns: repeat(12, 1fr); gap: 32px; }
-        .card { 
-            background: var(--surface); backdrop-filter: var(--glass); border: 1px solid var(--border); 
-            border-radius: 32px; padding: 32px; box-shadow: var(--card-shadow); transition: all 0.3s ease;
-        }
-        .card:hover { border-color: var(--primary); }
-        .card-title { font-size: 1.1rem; font-weight: 800; margin-bottom: 24px; display: flex; align-items: center; gap: 12px; }
-
-        .btn { 
-            padding: 16px; border-radius: 16px; font-weight: 800; font-size: 0.9rem; 
-            cursor: pointer; border: none; transition: all 0.3s ease; font-family: inherit;
-            display: flex; align-items: center; justify-content: center; gap: 10px;
-        }
-        .btn-primary { background: var(--primary); color: white; box-shadow: 0 4px 12px var(--primary-glow); }
-        .btn-outline { background: transparent; border: 2px solid var(--border); color: var(--text-main); }
-
-        .input-group { margin-bottom: 20px; }
-        .input-label { display: block; font-size: 0.75rem; color: var(--text-dim); margin-bottom: 8px; font-weight: 800; text-transform: uppercase; letter-spacing: 1px; }
-        .text-input { 
-            width: 100%; background: rgba(0, 0, 0, 0.05); border: 1px solid var(--border); 
-            border-radius: 16px; padding: 14px 20px; color: var(--text-main); font-family: inherit;
-        }
-
-        .stat-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; }
-        .stat-item { background: rgba(124, 58, 237, 0.05); padding: 24px; border-radius: 24px; text-align: center; border: 1px solid var(--border); }
-        .stat-val { font-size: 2rem; font-weight: 800; }
-
-        .toggle-row { display: flex; justify-content: space-between; align-items: center; padding: 12px 0; }
-        .switch { position: relative; display: inline-block; width: 44px; height: 24px; }
-        .switch input { opacity: 0; width: 0; height: 0; }
-        .slider { 
-            position: absolute; cursor: pointer; top: 0; left: 0; right: 0; bottom: 0; 
-            background-color: var(--border); transition: .4s; border-radius: 34px; 
-        }
-        .slider:before { 
-            position: absolute; content: ""; height: 18px; width: 18px; left: 3px; bottom: 3px; 
-            background-color: white; transition: .4s; border-radius: 50%; 
-        }
-        input:checked + .slider { background-color: var(--secondary); }
-        input:checked + .slider:before { transform: translateX(20px); }
-
-        #neural-terminal-view { display: none; padding: 20px; height: 100%; }
-        .chat-layout { height: 100%; display: grid; grid-template-columns: 1fr 340px; gap: 32px; max-width: 1600px; margin: 0 auto; }
-        
-        .chat-main { 
-            display: flex; flex-direction: column; background: var(--surface); 
-            border: 1px solid var(--border); border-radius: 40px; 
-            box-shadow: 0 30px 60px -12px rgba(0,0,0,0.5);
-            overflow: hidden; backdrop-filter: var(--glass);
-        }
-        
-        #chat-messages { 
-            flex: 1; overflow-y: auto; padding: 40px; display: flex; 
-            flex-direction: column; gap: 32px; scroll-behavior: smooth;
-            background: radial-gradient(circle at top right, rgba(139, 92, 246, 0.05), transparent 40%);
-        }
-        
-        .msg { 
-            max-width: 75%; padding: 20px 28px; border-radius: 28px; line-height: 1.7; 
-            font-size: 1rem; position: relative; transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            animation: msgEnter 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        @keyframes msgEnter { from { opacity: 0; transform: translateY(20px) scale(0.98); } to { opacity: 1; transform: translateY(0) scale(1); } }
-        
-        .msg-user { 
-            align-self: flex-end; background: var(--bubble-user); color: white; 
-            border-bottom-right-radius: 4px; box-shadow: 0 15px 30px rgba(139, 92, 246, 0.3);
-            font-weight: 500;
-        }
-        
-        .msg-ai { 
-            align-self: flex-start; background: var(--bubble-ai); color: var(--text-main); 
-            border-bottom-left-radius: 4px; border: 1px solid var(--border);
-            backdrop-filter: blur(10px); box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-        }
-        
-        .chat-input-area { 
-            padding: 30px 40px; background: var(--input-area-bg); 
-            border-top: 1px solid var(--border); display: flex; gap: 20px; align-items: center;
-        }
-        
-        .chat-field {
-            flex: 1; background: var(--input-bg); border: 1px solid var(--border);
-            border-radius: 20px; padding: 18px 24px; color: var(--text-main); font-family: inherit;
-            font-size: 1rem; transition: 0.3s;
-        }
-        .chat-field:focus { border-color: var(--primary); outline: none; background: rgba(255,255,255,0.08); box-shadow: 0 0 20px var(--primary-glow); }
-        
-        .pulse {
-            width: 8px; height: 8px; background: var(--accent); border-radius: 50%;
-            display: inline-block; margin-right: 8px; box-shadow: 0 0 10px var(--accent);
-            animation: synapticPulse 1.5s infinite;
-        }
-        @keyframes synapticPulse { 0% { opacity: 0.3; transform: scale(0.8); } 50% { opacity: 1; transform: scale(1.2); } 100% { opacity: 0.3; transform: scale(0.8); } }
-        
-        .send-btn {
-            width: 56px; height: 56px; border-radius: 20px; background: var(--primary-gradient);
-            border: none; color: white; cursor: pointer; display: flex; align-items: center;
-            justify-content: center; font-size: 1.2rem; transition: 0.3s;
-            box-shadow: 0 10px 20px var(--primary-glow);
-        }
-        .send-btn:hover { transform: scale(1.05) rotate(5deg); box-shadow: 0 15px 30px var(--primary-glow); }
-        .send-btn:disabled { opacity: 0.5; cursor: wait; }
-        .p-pill { 
-            padding: 10px 18px; border-radius: 14px; background: rgba(0,0,0,0.1); 
-            border: 1px solid var(--border); cursor: pointer; transition: all 0.3s;
-            font-size: 0.8rem; font-weight: 700; color: var(--text-dim);
-        }
-        .p-pill:hover { border-color: var(--primary); color: var(--text-main); }
-        .p-pill.active { background: var(--primary); color: white; border-color: var(--primary); box-shadow: 0 4px 12px var(--primary-glow); }
-
-        .dot { 
-            width: 5px; height: 5px; background: var(--primary); border-radius: 50%; 
-            opacity: 0.6; box-shadow: 0 0 8px var(--primary);
-            animation: pulse-neon 1.5s infinite ease-in-out; 
-        }
-        .dot:nth-child(2) { animation-delay: 0.2s; }
-        .dot:nth-child(3) { animation-delay: 0.4s; }
-        @keyframes pulse-neon { 
-            0%, 100% { transform: scale(1); opacity: 0.4; box-shadow: 0 0 2px var(--primary); } 
-            50% { transform: scale(1.4); opacity: 1; box-shadow: 0 0 12px var(--primary); } 
-        }
-        @keyframes fadeIn { from { opacity: 0; transform: translateY(5px); } to { opacity: 1; transform: translateY(0); } }
-
-        .eye-btn {
-            position: absolute; right: 12px; top: 50%; transform: translateY(-50%);
-            background: none; border: none; cursor: pointer; font-size: 1.2rem;
-            opacity: 0.6; transition: opacity 0.2s;
-        }
-        .eye-btn:hover { opacity: 1; }
-
-        #web-search-toggle { transition: all 0.3s; border: 1px solid var(--border); }
-        #web-search-toggle.active { background: rgba(0, 255, 157, 0.2); color: var(--secondary); border-color: var(--secondary); box-shadow: 0 0 10px rgba(0,255,157,0.2); }
-
-        .channel-group { 
-            background: rgba(255, 255, 255, 0.02); padding: 20px; border-radius: 20px; border: 1px solid var(--border);
-            transition: all 0.3s ease;
-        }
-        .channel-group.offline { opacity: 0.4; pointer-events: none; }
-        .channel-group.offline .switch { pointer-events: all; }
-
-        #admin-panel { display: none; }
-        ::-webkit-scrollbar { width: 8px; }
-        ::-webkit-scrollbar-thumb { background: var(--border); border-radius: 10px; }
-
-        .security-card {
-            background: rgba(239, 68, 68, 0.1);
-            border: 2px solid var(--danger);
-            border-radius: 20px;
-            padding: 24px;
-            margin: 10px 0;
-            animation: pulse-border 2s infinite;
-        }
-        @keyframes pulse-border {
-            0% { border-color: rgba(239, 68, 68, 0.4); }
-            50% { border-color: rgba(239, 68, 68, 1); }
-            100% { border-color: rgba(239, 68, 68, 0.4); }
-        }
-
-        /* Toast Notifications */
-        #toast-container {
-            position: fixed;
-            top: 24px;
-            right: 24px;
-            z-index: 100000;
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-            pointer-events: none;
-        }
-        .toast {
-            min-width: 300px;
-            padding: 16px 24px;
-            border-radius: 16px;
-            background: var(--surface);
-            backdrop-filter: var(--glass);
-            border: 1px solid var(--border);
-            color: var(--text-main);
-            box-shadow: var(--card-shadow);
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            pointer-events: auto;
-            animation: toastEnter 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            font-weight: 600;
-            font-size: 0.9rem;
-        }
-        @keyframes toastEnter {
-            from { opacity: 0; transform: translateX(20px); }
-            to { opacity: 1; transform: translateX(0); }
-        }
-        .toast.exit {
-            animation: toastExit 0.4s forwards;
-        }
-        @keyframes toastExit {
-            to { opacity: 0; transform: translateX(20px); }
-        }
-        .toast-success { border-left: 4px solid var(--secondary); }
-        .toast-error { border-left: 4px solid var(--danger); }
-        .toast-info { border-left: 4px solid var(--primary); }
-
-        /* Mobile Responsiveness */
-        @media (max-width: 1024px) {
-            .dashboard-grid { grid-template-columns: 1fr; }
-            .card { grid-column: span 12 !important; }
-        }
-
-        @media (max-width: 768px) {
-            .sidebar {
-                width: 100%;
-                height: auto;
-                position: fixed;
-                bottom: 0;
-                left: 0;
-                top: auto;
-                flex-direction: row;
-                padding: 10px 20px;
-                z-index: 1000;
-                border-right: none;
-                border-top: 1px solid var(--border);
-                justify-content: space-around;
-            }
-            .sidebar-logo { display: none; }
-            .nav-list { flex-direction: row; width: 100%; justify-content: space-around; gap: 0; }
-            .nav-item { padding: 10px; font-size: 0.7rem; flex-direction: column; gap: 4px; border-radius: 12px; }
-            .nav-item i { margin-right: 0; font-size: 1.2rem; }
-            
-            .main-stage { margin-left: 0; margin-bottom: 70px; padding: 15px; }
-            .header-bar { padding: 10px 0; }
-            .container { padding: 0; }
-            
-            .stat-grid { grid-template-columns: 1fr; gap: 10px; }
-            .card { padding: 20px; border-radius: 20px; }
-            
-            #display-user, .btn-outline[onclick="doLogout()"] { display: none; }
-            
-            .chat-container { height: calc(100vh - 200px); }
-            .chat-input-area { padding: 15px 20px; flex-wrap: wrap; }
-            .chat-field { order: 1; min-width: 200px; }
-            .send-btn { order: 2; }
-            
-            .toast { min-width: 90%; right: 5%; left: 5%; top: 12px; }
-        }
-    </style>
+    <link rel="stylesheet" href="__DASHBOARD_CSS__">
 </head>
 <body>
     <div id="toast-container"></div>
@@ -889,23 +761,23 @@ DASHBOARD_HTML = """
             <p style="color: var(--text-dim); margin-bottom: 32px;">Platform Control Center</p>
             <div class="input-group"><span class="input-label">Username</span><input type="text" id="auth-username" class="text-input"></div>
             <div class="input-group"><span class="input-label">Password</span><input type="password" id="auth-password" class="text-input"></div>
-            <button class="btn btn-primary" style="width: 100%;" onclick="doLogin()">Enter System 🔐</button>
-            <button class="btn btn-outline" style="width: 100%; margin-top: 16px;" onclick="showAuthView('register-view')">Register Agent</button>
+            <button class="btn btn-primary" style="width: 100%;" data-action="doLogin">Enter System 🔐</button>
+            <button class="btn btn-outline" style="width: 100%; margin-top: 16px;" data-action="showAuthView" data-arg="register-view">Register Agent</button>
         </div>
         <div class="auth-card" id="register-view" style="display: none;">
             <h1 style="margin-bottom: 8px; font-weight: 800;">New Profile</h1>
             <p style="color: var(--text-dim); margin-bottom: 32px;">Initialize Neural Protocol</p>
             <div class="input-group"><span class="input-label">Username</span><input type="text" id="reg-username" class="text-input"></div>
             <div class="input-group"><span class="input-label">Password</span><input type="password" id="reg-password" class="text-input"></div>
-            <button class="btn btn-primary" style="width: 100%;" onclick="doRegister()">Initialize Account 🚀</button>
-            <button class="btn btn-outline" style="width: 100%; margin-top: 16px;" onclick="showAuthView('login-view')">Back to Auth</button>
+            <button class="btn btn-primary" style="width: 100%;" data-action="doRegister">Initialize Account 🚀</button>
+            <button class="btn btn-outline" style="width: 100%; margin-top: 16px;" data-action="showAuthView" data-arg="login-view">Back to Auth</button>
         </div>
         <div class="auth-card" id="link-view" style="display: none;">
             <h1 style="margin-bottom: 8px; font-weight: 800;">Neural Link</h1>
             <p style="color: var(--text-dim); margin-bottom: 32px;">Sync platform identity</p>
             <div class="input-group"><span class="input-label">Architecture</span><select id="link-platform" class="text-input"><option value="telegram">Telegram</option><option value="discord">Discord</option></select></div>
             <div class="input-group"><span class="input-label">Protocol ID</span><input type="text" id="link-id" class="text-input" placeholder="Platform user ID"></div>
-            <button class="btn btn-primary" style="width: 100%;" onclick="doLink()">Secure Link 🔗</button>
+            <button class="btn btn-primary" style="width: 100%;" data-action="doLink">Secure Link 🔗</button>
         </div>
     </div>
 
@@ -914,14 +786,14 @@ DASHBOARD_HTML = """
         <div>
             <div class="sidebar-logo">🦞 YOUCLAW <span style="font-size: 0.6rem; color: var(--primary);">V4.9.5</span></div>
             <div class="nav-list">
-                <div class="nav-item active" id="nav-dash" onclick="switchView('dashboard')"><i>📊</i> Control Center</div>
-                <div class="nav-item" id="nav-chat" onclick="switchView('chat')"><i>💬</i> Neural Terminal</div>
+                <div class="nav-item active" id="nav-dash" data-action="switchView" data-arg="dashboard"><i>📊</i> Control Center</div>
+                <div class="nav-item" id="nav-chat" data-action="switchView" data-arg="chat"><i>💬</i> Neural Terminal</div>
             </div>
         </div>
         <div style="margin-top: auto;">
             <div style="font-size: 0.7rem; color: var(--text-dim); font-weight: 800; text-transform: uppercase;">Operator</div>
             <div id="display-user" style="font-weight: 800; color: var(--primary); margin-top: 4px;">...</div>
-            <button class="btn btn-outline" style="margin-top: 20px; width: 100%; padding: 12px;" onclick="doLogout()">Sign Out</button>
+            <button class="btn btn-outline" style="margin-top: 20px; width: 100%; padding: 12px;" data-action="doLogout">Sign Out</button>
         </div>
     </nav>
 
@@ -929,7 +801,7 @@ DASHBOARD_HTML = """
     <main class="main-stage">
         <div class="container" id="main-container">
             <div class="header-bar">
-                <button class="theme-toggle" id="theme-btn" onclick="toggleTheme()">🌓</button>
+                <button class="theme-toggle" id="theme-btn" data-action="toggleTheme" aria-label="Toggle theme"></button>
             </div>
 
             <!-- View 1: Control Center Dashboard -->
@@ -938,7 +810,7 @@ DASHBOARD_HTML = """
                     <div class="card" style="grid-column: span 12; border-color: var(--danger); display: none;" id="link-warning">
                         <div style="display: flex; justify-content: space-between; align-items: center;">
                             <div><h3 style="color: var(--danger); font-weight: 800;">⚠️ Connectivity Restricted</h3><p style="color: var(--text-dim);">Identity link required for full mission capability.</p></div>
-                            <button class="btn btn-primary" style="width: auto;" onclick="showAuthView('link-view')">Sync Identity</button>
+                            <button class="btn btn-primary" style="width: auto;" data-action="showAuthView" data-arg="link-view">Sync Identity</button>
                         </div>
                     </div>
 
@@ -958,7 +830,7 @@ DASHBOARD_HTML = """
                             <input type="text" id="vault-ollama" class="text-input" placeholder="http://localhost:11434">
                         </div>
                          <div style="font-size: 0.8rem; color: var(--text-dim); margin-top: -10px; margin-bottom: 12px;">Changing this will instantly verify connectivity.</div>
-                         <button class="btn btn-primary" onclick="saveSecrets(this)">Connect Core 🔌</button>
+                         <button class="btn btn-primary" data-action="saveSecrets">Connect Core 🔌</button>
                     </div>
 
                     <div class="card" style="grid-column: span 6;">
@@ -967,22 +839,22 @@ DASHBOARD_HTML = """
                             <div class="channel-group">
                                 <div class="toggle-row" style="padding: 0; margin-bottom: 12px;">
                                     <div><span style="font-weight: 700;">Telegram Protocol</span><div style="font-size: 0.8rem; color: var(--text-dim);">Active relay to global network</div></div>
-                                    <label class="switch"><input type="checkbox" id="toggle-tg" onchange="toggleChannel('telegram', this)"><span class="slider"></span></label>
+                                    <label class="switch"><input type="checkbox" id="toggle-tg" data-change="toggleChannel" data-arg="telegram"><span class="slider"></span></label>
                                 </div>
                                 <div class="input-group" style="margin: 0; position: relative;">
                                     <input type="password" id="vault-tg" class="text-input" placeholder="Telegram Token" style="padding-right: 50px;">
-                                    <button class="eye-btn" onclick="toggleSecret('vault-tg')">👁️</button>
+                                    <button class="eye-btn" data-action="toggleSecret" data-arg="vault-tg">👁️</button>
                                 </div>
                             </div>
 
                             <div class="channel-group">
                                 <div class="toggle-row" style="padding: 0; margin-bottom: 12px;">
                                     <div><span style="font-weight: 700;">Discord Architecture</span><div style="font-size: 0.8rem; color: var(--text-dim);">Secure tunnel to Discord guild</div></div>
-                                    <label class="switch"><input type="checkbox" id="toggle-dc" onchange="toggleChannel('discord', this)"><span class="slider"></span></label>
+                                    <label class="switch"><input type="checkbox" id="toggle-dc" data-change="toggleChannel" data-arg="discord"><span class="slider"></span></label>
                                 </div>
                                 <div class="input-group" style="margin: 0; position: relative;">
                                     <input type="password" id="vault-dc" class="text-input" placeholder="Discord Token" style="padding-right: 50px;">
-                                    <button class="eye-btn" onclick="toggleSecret('vault-dc')">👁️</button>
+                                    <button class="eye-btn" data-action="toggleSecret" data-arg="vault-dc">👁️</button>
                                 </div>
                             </div>
 
@@ -999,7 +871,7 @@ DASHBOARD_HTML = """
                             <div class="channel-group">
                                 <div class="toggle-row" style="padding: 0; margin-bottom: 12px;">
                                     <div><span style="font-weight: 700;">Email Node Protocol</span><div style="font-size: 0.8rem; color: var(--text-dim);">Neural link to IMAP/SMTP</div></div>
-                                    <label class="switch"><input type="checkbox" id="toggle-email" onchange="toggleChannel('email', this)"><span class="slider"></span></label>
+                                    <label class="switch"><input type="checkbox" id="toggle-email" data-change="toggleChannel" data-arg="email"><span class="slider"></span></label>
                                 </div>
                                 <div style="display: grid; grid-template-columns: 1fr 80px; gap: 8px; margin-bottom: 8px;">
                                     <input type="text" id="vault-imap-host" class="text-input" placeholder="IMAP Host">
@@ -1014,11 +886,11 @@ DASHBOARD_HTML = """
                                 </div>
                                 <div class="input-group" style="margin: 0; position: relative;">
                                     <input type="password" id="vault-email-pass" class="text-input" placeholder="Email Password" style="padding-right: 50px;">
-                                    <button class="eye-btn" onclick="toggleSecret('vault-email-pass')">👁️</button>
+                                    <button class="eye-btn" data-action="toggleSecret" data-arg="vault-email-pass">👁️</button>
                                 </div>
                             </div>
 
-                            <button class="btn btn-primary" style="margin-top: 8px;" onclick="saveSecrets(this)">Secure Vault 🔐</button>
+                            <button class="btn btn-primary" style="margin-top: 8px;" data-action="saveSecrets">Secure Vault 🔐</button>
                         </div>
                     </div>
 
@@ -1045,7 +917,7 @@ DASHBOARD_HTML = """
                             <input type="checkbox" id="cron-realtime" style="width: 20px; height: 20px;" checked>
                             <label for="cron-realtime" style="margin-bottom: 0;">Enable Real-Time Vision (Live Search)</label>
                         </div>
-                        <button class="btn btn-primary" style="width: 100%; margin-top: 15px;" onclick="scheduleCron()">Activate Cron Job 🚀</button>
+                        <button class="btn btn-primary" style="width: 100%; margin-top: 15px;" data-action="scheduleCron">Activate Cron Job 🚀</button>
                     </div>
 
                     <div class="card" style="grid-column: span 12;">
@@ -1070,8 +942,8 @@ DASHBOARD_HTML = """
                                     <select id="model-list" class="text-input"></select>
                                 </div>
                                 <div style="display: flex; gap: 16px;">
-                                    <button class="btn btn-outline" style="flex: 1;" onclick="switchModel(this)">Migrate Core</button>
-                                    <button class="btn btn-outline" style="flex: 1; color: var(--danger); border-color: var(--danger);" onclick="clearMemory()">Purge States</button>
+                                    <button class="btn btn-outline" style="flex: 1;" data-action="switchModel">Migrate Core</button>
+                                    <button class="btn btn-outline" style="flex: 1; color: var(--danger); border-color: var(--danger);" data-action="clearMemory">Purge States</button>
                                 </div>
                             </div>
                         </div>
@@ -1094,14 +966,15 @@ DASHBOARD_HTML = """
 
             </div>
 
-            <!-- View 2: Neural Terminal Chatbox -->
+            <!-- View 2: Neural Terminal Chatbox (mounted from the template on first visit) -->
+            <template id="tpl-terminal">
             <div id="neural-terminal-view">
                 <div class="chat-layout">
                     <div class="chat-main">
                         <div id="chat-messages"></div>
                         <div class="chat-input-area">
-                            <input type="text" id="chat-input" class="chat-field" placeholder="Whisper your intent..." onkeydown="if(event.key==='Enter') sendChat()">
-                            <button id="send-btn" class="send-btn" onclick="sendChat()">🚀</button>
+                            <input type="text" id="chat-input" class="chat-field" placeholder="Whisper your intent..." data-enter="sendChat">
+                            <button id="send-btn" class="send-btn" data-action="sendChat">🚀</button>
                         </div>
                     </div>
                     
@@ -1137,18 +1010,98 @@ DASHBOARD_HTML = """
                     </div>
                 </div>
             </div>
+            </template>
     </main>
 
+    <!-- Row templates for the polled lists: cloned per item instead of re-parsing HTML strings -->
+    <template id="tpl-job">
+        <div class="item-card">
+            <div class="job-id" style="font-weight: 800; font-size: 0.9rem;"></div>
+            <div class="job-prompt" style="font-size: 0.8rem; color: var(--text-dim); margin: 8px 0;"></div>
+            <button data-action="deleteJob" style="background:var(--danger); border:none; color:white; padding:6px 12px; border-radius:8px; font-weight:800; cursor:pointer; font-size:0.7rem;">ABORT</button>
+        </div>
+    </template>
+    <template id="tpl-job-empty">
+        <div style="grid-column: span 3; color: var(--text-dim); text-align:center;">No active heartbeats</div>
+    </template>
+    <template id="tpl-conv">
+        <div class="item-card">
+            <div class="conv-thread" style="font-size: 0.85rem; font-weight: 800;"></div>
+            <div class="conv-count" style="font-size: 0.75rem; color: var(--text-dim);"></div>
+        </div>
+    </template>
+
     <script>
-        let session_user = null;
-        let state_hash = { jobs: '', stats: '' };
+        // In-memory mirror of the few persisted keys: read once at boot, written back on pagehide
+        const KV = {};
+        ['yc_session_user', 'yc_session_token', 'yc_theme'].forEach(k => KV[k] = localStorage.getItem(k));
+        const kvDirty = new Set();
+        function kvSet(k, v) { KV[k] = v; kvDirty.add(k); }
+        function kvFlush() {
+            kvDirty.forEach(k => KV[k] == null ? localStorage.removeItem(k) : localStorage.setItem(k, KV[k]));
+            kvDirty.clear();
+        }
+        addEventListener('pagehide', kvFlush, { passive: true });
+        document.addEventListener('visibilitychange', () => { if(document.hidden) kvFlush(); }, { passive: true });
 
+        let session_user = null;
+        let session_token = null;
+
+        // Nodes the interactive paths touch on every call, resolved once
+        const R = {};
+        function bindRefs() {
+            R.navDash = document.getElementById('nav-dash');
+            R.navChat = document.getElementById('nav-chat');
+            R.navItems = [R.navDash, R.navChat];
+            R.dashView = document.getElementById('dashboard-view');
+            R.termView = null;  // Mounted lazily by mountTerminal()
+            R.toastContainer = document.getElementById('toast-container');
+            R.authOverlay = document.getElementById('auth-overlay');
+            R.authCards = [...document.querySelectorAll('.auth-card')];
+            R.jobsList = document.getElementById('jobs-list');
+            R.convsList = document.getElementById('conversations-list');
+            R.tplJob = document.getElementById('tpl-job').content.firstElementChild;
+            R.tplJobEmpty = document.getElementById('tpl-job-empty').content.firstElementChild;
+            R.tplConv = document.getElementById('tpl-conv').content.firstElementChild;
+            // Stats targets, rewritten on every change
+            R.linkWarn = document.getElementById('link-warning');
+            R.statMsg = document.getElementById('stat-messages');
+            R.statModel = document.getElementById('stat-model');
+            R.toggleTg = document.getElementById('toggle-tg');
+            R.toggleDc = document.getElementById('toggle-dc');
+            R.toggleTgGroup = R.toggleTg.closest('.channel-group');
+            R.toggleDcGroup = R.toggleDc.closest('.channel-group');
+            R.cronTg = document.getElementById('cron-opt-tg');
+            R.cronDc = document.getElementById('cron-opt-dc');
+            R.adminPanel = document.getElementById('admin-panel');
+            R.modelList = document.getElementById('model-list');
+            R.personaList = document.getElementById('personality-container');
+            R.soulDisp = document.getElementById('current-soul-display');
+            // Vault form fields (loadVault / saveSecrets)
+            R.vault = {};
+            for(const [key, id] of Object.entries({
+                tg: 'vault-tg', dc: 'vault-dc', search: 'vault-search', ollama: 'vault-ollama',
+                emailOn: 'toggle-email', imapHost: 'vault-imap-host', imapPort: 'vault-imap-port',
+                smtpHost: 'vault-smtp-host', smtpPort: 'vault-smtp-port', emailUser: 'vault-email-user',
+                emailPass: 'vault-email-pass'
+            })) R.vault[key] = document.getElementById(id);
+        }
+        let state_hash = { jobs: '', stats: '', convs: '' };
+
+        // Rapid toggles within a frame collapse into one data-theme flip (one style recalc)
+        let themePending = null;
+        let themeFrame = 0;
         function toggleTheme() {
             const html = document.documentElement;
-            const newTheme = html.getAttribute('data-theme') === 'dark' ? 'light' : 'dark';
-            html.setAttribute('data-theme', newTheme);
-            localStorage.setItem('yc_theme', newTheme);
-            document.getElementById('theme-btn').innerText = newTheme === 'dark' ? '🌓' : '☀️';
+            themePending = (themePending || html.getAttribute('data-theme')) === 'dark' ? 'light' : 'dark';
+            if(themeFrame) return;
+            themeFrame = requestAnimationFrame(() => {
+                const target = themePending;
+                themeFrame = 0; themePending = null;
+                if(html.getAttribute('data-theme') === target) return;
+                html.setAttribute('data-theme', target);
+                kvSet('yc_theme', target);
+            });
         }
 
         function toggleSecret(id) {
@@ -1162,25 +1115,45 @@ DASHBOARD_HTML = """
             document.getElementById('web-search-toggle').classList.toggle('active', webMode);
         }
 
+        // The chat view costs no style/layout work until it is first opened
+        function mountTerminal() {
+            if(R.termView) return;
+            const tpl = document.getElementById('tpl-terminal');
+            R.termView = tpl.content.firstElementChild.cloneNode(true);
+            tpl.replaceWith(R.termView);
+            R.chatInput = document.getElementById('chat-input');
+            R.sendBtn = document.getElementById('send-btn');
+            R.chatBox = document.getElementById('chat-messages');
+            R.searchStatus = document.getElementById('search-status');
+            R.statMsgChat = document.getElementById('stat-messages-chat');
+            R.statModelChat = document.getElementById('stat-model-chat');
+            R.personaListChat = document.getElementById('personality-container-chat');
+            R.soulChat = document.getElementById('current-soul-display-chat');
+            watchAnimations(R.termView);
+            // Fill the chat sidebar from what the dashboard already knows
+            if(lastStats) renderStats(lastStats, true);
+            if(window.personalitiesLoaded) loadPersonalities();
+        }
+
         function switchView(view) {
-            document.querySelectorAll('.nav-item').forEach(i => i.classList.remove('active'));
-            document.getElementById('dashboard-view').style.display = 'none';
-            document.getElementById('neural-terminal-view').style.display = 'none';
+            R.navItems.forEach(i => i.classList.remove('active'));
+            R.dashView.style.display = 'none';
+            if(R.termView) R.termView.style.display = 'none';
             
             if(view === 'dashboard') {
-                document.getElementById('nav-dash').classList.add('active');
-                document.getElementById('dashboard-view').style.display = 'block';
+                R.navDash.classList.add('active');
+                R.dashView.style.display = 'block';
             } else {
-                document.getElementById('nav-chat').classList.add('active');
-                document.getElementById('neural-terminal-view').style.display = 'block';
-                document.getElementById('chat-input').focus();
+                mountTerminal();
+                R.navChat.classList.add('active');
+                R.termView.style.display = 'block';
+                R.chatInput.focus();
             }
         }
 
         function showAuthView(id) {
-            document.querySelectorAll('.auth-card').forEach(v => v.style.display = 'none');
-            document.getElementById(id).style.display = 'block';
-            document.getElementById('auth-overlay').style.display = 'flex';
+            R.authCards.forEach(v => v.style.display = v.id === id ? 'block' : 'none');
+            R.authOverlay.style.display = 'flex';
         }
 
         async function doRegister() {
@@ -1197,8 +1170,8 @@ DASHBOARD_HTML = """
             const res = await apiCall('/api/auth/login', 'POST', { username:u, password:p });
             if(res.success && res.user.token) {
                 session_user = u;
-                localStorage.setItem('yc_session_user', u);
-                localStorage.setItem('yc_session_token', res.user.token);
+                kvSet('yc_session_user', u);
+                kvSet('yc_session_token', res.user.token);
                 initDashboard();
                 showToast("Neural sync established.", "success");
             } else showToast("Neural auth failed.", "error");
@@ -1213,95 +1186,210 @@ DASHBOARD_HTML = """
         }
 
         function doLogout() { 
-            localStorage.removeItem('yc_session_user'); 
-            localStorage.removeItem('yc_session_token');
+            kvSet('yc_session_user', null);
+            kvSet('yc_session_token', null);
+            kvFlush();
             location.reload(); 
         }
 
-        function toggleTheme() {
-            const current = document.documentElement.getAttribute('data-theme');
-            const target = current === 'dark' ? 'light' : 'dark';
-            document.documentElement.setAttribute('data-theme', target);
-            localStorage.setItem('yc_theme', target);
-            document.getElementById('theme-btn').innerText = target === 'dark' ? '🌓' : '☀️';
+        // GET url -> { etag, data } for If-None-Match revalidation, and GET url -> pending promise
+        // so overlapping polls of the same endpoint share one round-trip
+        const _apiCache = new Map();
+        const _inflight = new Map();
+
+        function apiCall(url, method = 'GET', body = null) {
+            if(method !== 'GET') return fetchJson(url, method, body);
+            if(_inflight.has(url)) return _inflight.get(url);
+            const pending = fetchJson(url, method, body).finally(() => _inflight.delete(url));
+            _inflight.set(url, pending);
+            return pending;
         }
 
-        async function apiCall(url, method = 'GET', body = null) {
-            const token = localStorage.getItem('yc_session_token');
+        async function fetchJson(url, method, body) {
             const h = { 
                 'X-Session-User': session_user, 
-                'X-Session-Token': token,
+                'X-Session-Token': session_token,
                 'Content-Type': 'application/json' 
             };
+            const cached = method === 'GET' ? _apiCache.get(url) : undefined;
+            if(cached) h['If-None-Match'] = cached.etag;
             const options = { method, headers: h };
             if (body) options.body = JSON.stringify(body);
             const res = await fetch(url, options);
+            if(res.status === 304 && cached) return cached.data;
             const data = await res.json();
+            const etag = res.headers.get('ETag');
+            if(method === 'GET' && res.ok && etag) _apiCache.set(url, { etag, data });
             return data;
         }
 
+        const TOAST_ICONS = { success: '✅', error: '❌', info: 'ℹ️' };
+
+        // Toasts raised in the same tick are inserted together, once per frame
+        const _pendingToasts = [];
+        let _toastFrame = 0;
+        function flushToasts() {
+            _toastFrame = 0;
+            const frag = document.createDocumentFragment();
+            _pendingToasts.forEach(t => frag.appendChild(t));
+            _pendingToasts.length = 0;
+            R.toastContainer.appendChild(frag);
+        }
+
         function showToast(message, type = 'info') {
-            const container = document.getElementById('toast-container');
             const toast = document.createElement('div');
             toast.className = `toast toast-${type}`;
-            const icon = type === 'success' ? '✅' : (type === 'error' ? '❌' : 'ℹ️');
+            const icon = TOAST_ICONS[type] || TOAST_ICONS.info;
             toast.innerHTML = `<span>${icon}</span> <span>${message}</span>`;
-            container.appendChild(toast);
+            // Only hint the compositor while the enter/exit animation is actually running
+            toast.style.willChange = 'transform, opacity';
+            toast.addEventListener('animationend', () => { toast.style.willChange = ''; });
+            _pendingToasts.push(toast);
+            if(!_toastFrame) _toastFrame = requestAnimationFrame(flushToasts);
             
             setTimeout(() => {
+                toast.style.willChange = 'transform, opacity';
                 toast.classList.add('exit');
                 setTimeout(() => toast.remove(), 400);
             }, 4000);
         }
 
         async function initDashboard() {
-            session_user = localStorage.getItem('yc_session_user');
+            session_user = KV.yc_session_user;
+            session_token = KV.yc_session_token;
             if(!session_user) return showAuthView('login-view');
             
-            const savedTheme = localStorage.getItem('yc_theme') || 'dark';
+            const savedTheme = KV.yc_theme || 'dark';
             document.documentElement.setAttribute('data-theme', savedTheme);
-            document.getElementById('theme-btn').innerText = savedTheme === 'dark' ? '🌓' : '☀️';
 
-            document.getElementById('auth-overlay').style.display = 'none';
+            R.authOverlay.style.display = 'none';
             document.getElementById('app-sidebar').style.display = 'flex';
             document.getElementById('main-container').classList.add('active');
             document.getElementById('display-user').innerText = session_user;
 
-            updateDashboard();
-            setInterval(updateDashboard, 5000);
+            openEvents();
+        }
+
+        // Push channel: /api/events sends stats/jobs/conversations only when they change.
+        // Read with fetch() rather than EventSource so the session headers stay out of the URL.
+        let eventsRetry = 1000;
+
+        // Fallback poll while the stream is down: self-scheduling, doubling its delay (5s -> 60s)
+        // while nothing changes, and idle whenever the tab is hidden
+        const POLL_MIN = 5000, POLL_MAX = 60000;
+        let polling = false, pollBusy = false, pollTimer = null, pollDelay = POLL_MIN;
+
+        function startPolling() { if(!polling) { polling = true; pollDelay = POLL_MIN; pollTick(); } }
+        function stopPolling() { polling = false; clearTimeout(pollTimer); pollTimer = null; }
+
+        async function pollTick() {
+            clearTimeout(pollTimer); pollTimer = null;
+            if(!polling || pollBusy || document.hidden) return;  // Hidden: visibilitychange resumes us
+            pollBusy = true;
+            const before = state_hash.stats + state_hash.jobs + state_hash.convs;
+            try { await updateDashboard(); } catch (err) {} finally { pollBusy = false; }
+            const changed = state_hash.stats + state_hash.jobs + state_hash.convs !== before;
+            pollDelay = changed ? POLL_MIN : Math.min(pollDelay * 2, POLL_MAX);
+            if(polling && !document.hidden) pollTimer = setTimeout(pollTick, pollDelay);
+        }
+
+        document.addEventListener('visibilitychange', () => {
+            if(polling && !document.hidden) { pollDelay = POLL_MIN; pollTick(); }
+        }, { passive: true });
+
+        function parseSseFrame(frame) {
+            let event = 'message', data = '';
+            for(const line of frame.split('\\n')) {
+                if(line.startsWith('event:')) event = line.slice(6).trim();
+                else if(line.startsWith('data:')) data += (data ? '\\n' : '') + line.slice(5).replace(/^ /, '');
+            }
+            return { event, data };
+        }
+
+        function handleDashboardEvent(frame) {
+            const { event, data } = parseSseFrame(frame);
+            if(!data) return;
+            const payload = JSON.parse(data);
+            if(event === 'stats') renderStats(payload);
+            else if(event === 'jobs') renderJobs(payload);
+            else if(event === 'conversations') renderConversations(payload);
+        }
+
+        async function openEvents() {
+            try {
+                const res = await fetch('/api/events', {
+                    headers: { 'X-Session-User': session_user, 'X-Session-Token': session_token }
+                });
+                if(!res.ok) throw new Error(`events ${res.status}`);
+                stopPolling();
+                eventsRetry = 1000;
+                const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buf = '';
+                while(true) {
+                    const { done, value } = await reader.read();
+                    if(done) break;
+                    buf += value;
+                    let cut;
+                    while((cut = buf.indexOf('\\n\\n')) >= 0) {
+                        handleDashboardEvent(buf.slice(0, cut));
+                        buf = buf.slice(cut + 2);
+                    }
+                }
+            } catch (err) {}
+            // Stream dropped: poll meanwhile and reconnect with exponential backoff
+            startPolling();
+            setTimeout(openEvents, eventsRetry);
+            eventsRetry = Math.min(eventsRetry * 2, 60000);
         }
 
         async function updateDashboard() {
-            const stats = await apiCall('/api/stats');
+            // Independent endpoints: one round-trip of latency instead of three
+            const [stats, jobs, convs] = await Promise.all([
+                apiCall('/api/stats'), apiCall('/api/jobs'), apiCall('/api/conversations')
+            ]);
             if(!stats || stats.error) return;
+            renderStats(stats);
+            if(jobs && !jobs.error) renderJobs(jobs);
+            if(convs && !convs.error) renderConversations(convs);
+            
+            // Sync Mission Control if active
+            const missionView = document.getElementById('mission-view');
+            if(missionView && missionView.style.display === 'block') {
+                updateMissionControl();
+            }
+        }
 
-            document.getElementById('link-warning').style.display = stats.is_linked ? 'none' : 'block';
-            document.getElementById('stat-messages').innerText = stats.user_messages;
-            document.getElementById('stat-model').innerText = stats.model;
+        let lastStats = null;
+        function renderStats(stats, force = false) {
+            lastStats = stats;
+            // timestamp changes on every build; anything else changing means there is something to draw
+            const h = JSON.stringify({ ...stats, timestamp: null });
+            if(h === state_hash.stats && !force) return;
+            state_hash.stats = h;
+            R.linkWarn.style.display = stats.is_linked ? 'none' : 'block';
+            R.statMsg.textContent = stats.user_messages;
+            R.statModel.textContent = stats.model;
             
-            const msgChat = document.getElementById('stat-messages-chat');
-            const modelChat = document.getElementById('stat-model-chat');
-            if(msgChat) msgChat.innerText = stats.user_messages;
-            if(modelChat) modelChat.innerText = stats.model;
+            // Chat sidebar only exists once the terminal view has been mounted
+            if(R.statMsgChat) R.statMsgChat.textContent = stats.user_messages;
+            if(R.statModelChat) R.statModelChat.textContent = stats.model;
 
-            document.getElementById('toggle-tg').checked = stats.telegram_enabled;
-            document.getElementById('toggle-dc').checked = stats.discord_enabled;
+            R.toggleTg.checked = stats.telegram_enabled;
+            R.toggleDc.checked = stats.discord_enabled;
             
             // Sync Cron Channel Detection
-            const cronTg = document.getElementById('cron-opt-tg');
-            const cronDc = document.getElementById('cron-opt-dc');
-            cronTg.disabled = !stats.telegram_enabled;
-            cronDc.disabled = !stats.discord_enabled;
-            cronTg.innerText = stats.telegram_enabled ? "Telegram Bot" : "Telegram (Offline)";
-            cronDc.innerText = stats.discord_enabled ? "Discord Bot" : "Discord (Offline)";
+            R.cronTg.disabled = !stats.telegram_enabled;
+            R.cronDc.disabled = !stats.discord_enabled;
+            R.cronTg.textContent = stats.telegram_enabled ? "Telegram Bot" : "Telegram (Offline)";
+            R.cronDc.textContent = stats.discord_enabled ? "Discord Bot" : "Discord (Offline)";
 
             // Update Channel Group States
-            document.getElementById('toggle-tg').closest('.channel-group').classList.toggle('offline', !stats.telegram_enabled);
-            document.getElementById('toggle-dc').closest('.channel-group').classList.toggle('offline', !stats.discord_enabled);
+            R.toggleTgGroup.classList.toggle('offline', !stats.telegram_enabled);
+            R.toggleDcGroup.classList.toggle('offline', !stats.discord_enabled);
             
             if(stats.is_admin) {
-                document.getElementById('admin-panel').style.display = 'block';
-                const ms = document.getElementById('model-list');
+                R.adminPanel.style.display = 'block';
+                const ms = R.modelList;
                 if(ms.options.length === 0 && stats.available_models) {
                     stats.available_models.forEach(m => {
                         const o = document.createElement('option'); o.value = o.innerText = m;
@@ -1310,38 +1398,55 @@ DASHBOARD_HTML = """
                     });
                 }
                 if(!window.vaultLoaded) { loadVault(); window.vaultLoaded = true; }
-                if(!window.personalitiesLoaded) loadPersonalities();
+                // Fire-and-forget so they race the rest of the tick; the sentinel is set up
+                // front so a second tick doesn't start a duplicate load
+                if(!window.personalitiesLoaded) { window.personalitiesLoaded = true; loadPersonalities(); }
             }
+        }
 
-            const jobs = await apiCall('/api/jobs');
-            if(jobs && !jobs.error && JSON.stringify(jobs.jobs) !== state_hash.jobs) {
-                document.getElementById('jobs-list').innerHTML = jobs.jobs.map(j => `
-                    <div class="item-card">
-                        <div style="font-weight: 800; font-size: 0.9rem;">#${j.id}</div>
-                        <div style="font-size: 0.8rem; color: var(--text-dim); margin: 8px 0;">${j.prompt.substring(0,60)}...</div>
-                        <button onclick="deleteJob('${j.id}')" style="background:var(--danger); border:none; color:white; padding:6px 12px; border-radius:8px; font-weight:800; cursor:pointer; font-size:0.7rem;">ABORT</button>
-                    </div>
-                `).join('') || '<div style="grid-column: span 3; color: var(--text-dim); text-align:center;">No active heartbeats</div>';
-                state_hash.jobs = JSON.stringify(jobs.jobs);
+        // Keyed list render: rows are reused by key and only refilled when their item changed;
+        // new keys clone the template row. The result is swapped in with a single mutation.
+        function renderList(list, tpl, items, key, fill) {
+            const prev = list._rows || new Map();
+            const next = new Map();
+            const frag = document.createDocumentFragment();
+            for(const item of items) {
+                const k = key(item);
+                const sig = JSON.stringify(item);
+                const row = prev.get(k) || tpl.cloneNode(true);
+                if(row._sig !== sig) { fill(row, item); row._sig = sig; }
+                next.set(k, row);
+                frag.appendChild(row);
             }
+            list._rows = next;
+            list.replaceChildren(frag);
+        }
 
-            const convs = await apiCall('/api/conversations');
-            if(convs && !convs.error) {
-                document.getElementById('conversations-list').innerHTML = convs.conversations.map(c => `
-                    <div class="item-card">
-                        <div style="font-size: 0.85rem; font-weight: 800;">Thread: ${(c.channel_id || 'Direct').substring(0,8)}...</div>
-                        <div style="font-size: 0.75rem; color: var(--text-dim);">${c.message_count} states synced</div>
-                    </div>
-                `).join('');
-            }
-            
-            // Sync Mission Control if active
-            const missionView = document.getElementById('mission-view');
-            if(missionView && missionView.style.display === 'block') {
-                updateMissionControl();
+        function renderJobs(jobs) {
+            if(JSON.stringify(jobs.jobs) !== state_hash.jobs) {
+                if(!jobs.jobs.length) {
+                    R.jobsList._rows = null;
+                    R.jobsList.replaceChildren(R.tplJobEmpty.cloneNode(true));
+                }
+                else renderList(R.jobsList, R.tplJob, jobs.jobs, j => j.id, (row, j) => {
+                    row.querySelector('.job-id').textContent = `#${j.id}`;
+                    row.querySelector('.job-prompt').textContent = `${j.prompt.substring(0,60)}...`;
+                    row.querySelector('button').dataset.arg = j.id;
+                });
+                state_hash.jobs = JSON.stringify(jobs.jobs);
             }
         }
 
+        function renderConversations(convs) {
+            const h = JSON.stringify(convs.conversations);
+            if(h === state_hash.convs) return;
+            state_hash.convs = h;
+            renderList(R.convsList, R.tplConv, convs.conversations, c => `${c.platform}:${c.channel_id}`, (row, c) => {
+                row.querySelector('.conv-thread').textContent = `Thread: ${(c.channel_id || 'Direct').substring(0,8)}...`;
+                row.querySelector('.conv-count').textContent = `${c.message_count} states synced`;
+            });
+        }
+
         async function toggleChannel(channel, el) {
             const res = await apiCall('/api/system/toggle_channel', 'POST', { channel: channel, enabled: el.checked });
             if(!res.success) { showToast("Toggle Failure.", "error"); el.checked = !el.checked; }
@@ -1372,13 +1477,17 @@ DASHBOARD_HTML = """
         }
 
         async function sendChat() {
-            const input = document.getElementById('chat-input');
-            const btn = document.getElementById('send-btn');
+            const input = R.chatInput;
+            const btn = R.sendBtn;
             const msg = input.value.trim();
             if(!msg || btn.disabled) return;
             
-            const box = document.getElementById('chat-messages');
-            box.innerHTML += `<div class="msg msg-user">${msg}</div>`;
+            const box = R.chatBox;
+            // Append just the new bubble: innerHTML += would re-parse (and re-create) the whole history
+            const userMsg = document.createElement('div');
+            userMsg.className = 'msg msg-user';
+            userMsg.textContent = msg;
+            box.appendChild(userMsg);
             input.value = '';
             input.disabled = btn.disabled = true;
             
@@ -1386,68 +1495,90 @@ DASHBOARD_HTML = """
             indicator.className = 'typing-indicator';
             indicator.innerHTML = '<div class="typing-label">Thinking</div><div class="dot"></div><div class="dot"></div><div class="dot"></div>';
             box.appendChild(indicator);
+            watchAnimations(indicator);
             box.scrollTop = box.scrollHeight;
             
-            const searchStatus = document.getElementById('search-status');
-            if(searchStatus) searchStatus.innerHTML = '<span class="pulse"></span> Synapsing Neural Streams...';
+            const searchStatus = R.searchStatus;
+            if(searchStatus) { searchStatus.innerHTML = '<span class="pulse"></span> Synapsing Neural Streams...'; watchAnimations(searchStatus); }
 
             try {
                 const url = `/api/chat/stream?user=${encodeURIComponent(session_user)}&message=${encodeURIComponent(msg)}`;
-                const token = localStorage.getItem('yc_session_token');
                 const response = await fetch(url, {
-                    headers: { 'X-Session-User': session_user, 'X-Session-Token': token }
+                    headers: { 'X-Session-User': session_user, 'X-Session-Token': session_token }
                 });
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
+                if(!response.ok) throw new Error(`chat ${response.status}`);
+                // Same fetch-based SSE framing as /api/events: the session stays in headers, not the URL
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
                 
                 const aiMsg = document.createElement('div');
                 aiMsg.className = 'msg msg-ai';
                 let fullAiResponse = '';
+                // Chunks arriving within one frame share a single markdown parse and layout
+                let renderFrame = 0;
+                const renderAi = () => {
+                    renderFrame = 0;
+                    aiMsg.innerHTML = marked.parse(fullAiResponse);
+                    box.scrollTop = box.scrollHeight;
+                };
                 
                 let firstChunk = true;
-                while (true) {
+                let buf = '';
+                stream: while (true) {
                     const { done, value } = await reader.read();
                     if (done) break;
-                    
-                    if (firstChunk) {
-                        indicator.remove();
-                        box.appendChild(aiMsg);
-                        firstChunk = false;
-                    }
-                    
-                    const chunk = decoder.decode(value, { stream: true });
-                    fullAiResponse += chunk;
-                    
-                    if (fullAiResponse.includes("[SECURITY_INTERCEPT]")) {
-                        // Handle Iron Dome UI
-                        const parts = fullAiResponse.split(' ');
-                        const reqId = parts[1].split(':')[1];
-                        const cmd = parts[2].split(':')[1];
+                    buf += value;
+                    let cut;
+                    while ((cut = buf.indexOf('\\n\\n')) >= 0) {
+                        const { event, data } = parseSseFrame(buf.slice(0, cut));
+                        buf = buf.slice(cut + 2);
+                        if (event === 'done') break stream;
+                        if (event === 'error') throw new Error(JSON.parse(data));
                         
-                        aiMsg.className = 'msg msg-ai security-card';
-                        aiMsg.innerHTML = `
-                            <div style="font-weight: 800; color: var(--danger); margin-bottom: 10px;">🛡️ IRON DOME INTERCEPT</div>
-                            <p style="margin-bottom: 16px;">I need your permission to run: <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 6px;">${cmd}</code></p>
-                            <div style="display: flex; gap: 10px;">
-                                <button class="btn btn-primary" style="flex: 1; background: var(--secondary);" onclick="approveSecurity('${reqId}', this)">✅ Approve</button>
-                                <button class="btn btn-outline" style="flex: 1;" onclick="denySecurity('${reqId}', this)">❌ Deny</button>
-                            </div>
-                        `;
-                        // Stop streaming here
-                        break;
-                    } else {
-                        aiMsg.innerHTML = marked.parse(fullAiResponse);
+                        if (firstChunk) {
+                            indicator.remove();
+                            box.appendChild(aiMsg);
+                            firstChunk = false;
+                        }
+                        
+                        if (event === 'intercept') {
+                            cancelAnimationFrame(renderFrame);
+                            renderFrame = 0;
+                            // Handle Iron Dome UI: the server already parsed the intercept for us
+                            const { id: reqId, command: cmd } = JSON.parse(data);
+                            
+                            aiMsg.className = 'msg msg-ai security-card';
+                            aiMsg.innerHTML = `
+                                <div style="font-weight: 800; color: var(--danger); margin-bottom: 10px;">🛡️ IRON DOME INTERCEPT</div>
+                                <p style="margin-bottom: 16px;">I need your permission to run: <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 6px;">${cmd}</code></p>
+                                <div style="display: flex; gap: 10px;">
+                                    <button class="btn btn-primary" style="flex: 1; background: var(--secondary);" data-action="approveSecurity" data-arg="${reqId}">✅ Approve</button>
+                                    <button class="btn btn-outline" style="flex: 1;" data-action="denySecurity" data-arg="${reqId}">❌ Deny</button>
+                                </div>
+                            `;
+                            watchAnimations(aiMsg);
+                            // Stop streaming here
+                            break stream;
+                        }
+                        
+                        fullAiResponse += data;
+                        if (!renderFrame) renderFrame = requestAnimationFrame(renderAi);
                     }
-                    box.scrollTop = box.scrollHeight;
                 }
+                reader.cancel();
+                // Land the final text now rather than a frame later, so the scroll below sees its height
+                if (renderFrame) { cancelAnimationFrame(renderFrame); renderAi(); }
             } catch (err) {
                 if(indicator.parentNode) indicator.remove();
-                box.innerHTML += `<div class="msg msg-ai" style="color:var(--danger)">Protocol Fault</div>`;
+                const fault = document.createElement('div');
+                fault.className = 'msg msg-ai';
+                fault.style.color = 'var(--danger)';
+                fault.textContent = 'Protocol Fault';
+                box.appendChild(fault);
             } finally {
                 input.disabled = btn.disabled = false;
                 input.focus();
                 box.scrollTop = box.scrollHeight;
-                if(searchStatus) searchStatus.innerHTML = '<span class="pulse" style="background: var(--secondary);"></span> Listening for queries...';
+                if(searchStatus) { searchStatus.innerHTML = '<span class="pulse" style="background: var(--secondary);"></span> Listening for queries...'; watchAnimations(searchStatus); }
                 updateDashboard();
             }
         }
@@ -1461,18 +1592,19 @@ DASHBOARD_HTML = """
         async function loadVault() {
             const data = await apiCall('/api/system/env');
             if(data && !data.error) {
-                document.getElementById('vault-tg').value = data.telegram_token || "";
-                document.getElementById('vault-dc').value = data.discord_token || "";
-                document.getElementById('vault-search').value = data.search_url || "";
-                document.getElementById('vault-ollama').value = data.ollama_url || "";
+                const v = R.vault;
+                v.tg.value = data.telegram_token || "";
+                v.dc.value = data.discord_token || "";
+                v.search.value = data.search_url || "";
+                v.ollama.value = data.ollama_url || "";
                 
                 if(data.email) {
-                    document.getElementById('toggle-email').checked = data.email.enabled;
-                    document.getElementById('vault-imap-host').value = data.email.imap_host || "";
-                    document.getElementById('vault-imap-port').value = data.email.imap_port || 993;
-                    document.getElementById('vault-smtp-host').value = data.email.smtp_host || "";
-                    document.getElementById('vault-smtp-port').value = data.email.smtp_port || 587;
-                    document.getElementById('vault-email-user').value = data.email.user || "";
+                    v.emailOn.checked = data.email.enabled;
+                    v.imapHost.value = data.email.imap_host || "";
+                    v.imapPort.value = data.email.imap_port || 993;
+                    v.smtpHost.value = data.email.smtp_host || "";
+                    v.smtpPort.value = data.email.smtp_port || 587;
+                    v.emailUser.value = data.email.user || "";
                 }
             }
         }
@@ -1481,8 +1613,8 @@ DASHBOARD_HTML = """
             const data = await apiCall('/api/system/personality');
             if(!data || data.error) return;
             
-            const container = document.getElementById('personality-container');
-            const containerChat = document.getElementById('personality-container-chat');
+            const container = R.personaList;
+            const containerChat = R.personaListChat;
             if(container) container.innerHTML = '';
             if(containerChat) containerChat.innerHTML = '';
             
@@ -1491,19 +1623,16 @@ DASHBOARD_HTML = """
                 pill.className = `p-pill ${id === data.active ? 'active' : ''}`;
                 pill.innerText = p.name;
                 pill.title = p.description;
-                pill.onclick = () => switchPersonality(id);
+                pill.dataset.action = 'switchPersonality';
+                pill.dataset.arg = id;
                 
                 if(container) container.appendChild(pill);
                 
-                const pillChat = pill.cloneNode(true);
-                pillChat.onclick = () => switchPersonality(id);
-                if(containerChat) containerChat.appendChild(pillChat);
+                if(containerChat) containerChat.appendChild(pill.cloneNode(true));
             }
             const soulName = data.personalities[data.active].name;
-            const soulDisp = document.getElementById('current-soul-display');
-            const soulChat = document.getElementById('current-soul-display-chat');
-            if(soulDisp) soulDisp.innerText = soulName;
-            if(soulChat) soulChat.innerText = soulName;
+            if(R.soulDisp) R.soulDisp.textContent = soulName;
+            if(R.soulChat) R.soulChat.textContent = soulName;
             
             window.personalitiesLoaded = true;
         }
@@ -1518,18 +1647,19 @@ DASHBOARD_HTML = """
 
         async function saveSecrets(btn) {
             btn.innerText = "Syncing..."; btn.disabled = true;
+            const v = R.vault;
             const res = await apiCall('/api/system/secrets', 'POST', {
-                telegram_token: document.getElementById('vault-tg').value,
-                discord_token: document.getElementById('vault-dc').value,
-                search_url: document.getElementById('vault-search').value,
-                ollama_url: document.getElementById('vault-ollama').value,
+                telegram_token: v.tg.value,
+                discord_token: v.dc.value,
+                search_url: v.search.value,
+                ollama_url: v.ollama.value,
                 email: {
-                    imap_host: document.getElementById('vault-imap-host').value,
-                    imap_port: parseInt(document.getElementById('vault-imap-port').value),
-                    smtp_host: document.getElementById('vault-smtp-host').value,
-                    smtp_port: parseInt(document.getElementById('vault-smtp-port').value),
-                    user: document.getElementById('vault-email-user').value,
-                    password: document.getElementById('vault-email-pass').value
+                    imap_host: v.imapHost.value,
+                    imap_port: parseInt(v.imapPort.value),
+                    smtp_host: v.smtpHost.value,
+                    smtp_port: parseInt(v.smtpPort.value),
+                    user: v.emailUser.value,
+                    password: v.emailPass.value
                 }
             });
             if(res.success) {
@@ -1559,6 +1689,7 @@ DASHBOARD_HTML = """
         async function approveSecurity(reqId, btn) {
             const card = btn.closest('.security-card');
             card.innerHTML = `<div style="text-align: center; padding: 10px;"><span class="pulse"></span> Executing command...</div>`;
+            watchAnimations(card);
             
             try {
                 const res = await apiCall('/api/security/approve', 'POST', { action: 'approve', request_id: reqId });
@@ -1583,6 +1714,77 @@ DASHBOARD_HTML = """
             setTimeout(() => card.remove(), 2000);
         }
 
+        // One delegated listener per event type instead of an inline handler per element.
+        // Handlers receive (data-arg, element). None of them call preventDefault(), so all
+        // listeners are registered passive and never hold up compositor scrolling.
+        const PASSIVE = { passive: true };
+        // Leading-edge throttle: the first call runs at once, repeats within `ms` are dropped
+        function throttle(fn, ms) {
+            let last = 0;
+            return (...args) => { const now = Date.now(); if(now - last >= ms) { last = now; return fn(...args); } };
+        }
+        // Drop calls while the previous one is still in flight (one POST per submit)
+        function exclusive(fn) {
+            let busy = false;
+            return async (...args) => {
+                if(busy) return;
+                busy = true;
+                try { return await fn(...args); } finally { busy = false; }
+            };
+        }
+
+        const ACTIONS = {
+            doLogout, toggleTheme, toggleWebMode, clearMemory,
+            doLogin: exclusive(doLogin),
+            doRegister: exclusive(doRegister),
+            doLink: exclusive(doLink),
+            scheduleCron: exclusive(scheduleCron),
+            sendChat: throttle(sendChat, 300),
+            showAuthView: arg => showAuthView(arg),
+            switchView: arg => switchView(arg),
+            toggleSecret: arg => toggleSecret(arg),
+            saveSecrets: exclusive((arg, el) => saveSecrets(el)),
+            switchModel: (arg, el) => switchModel(el),
+            switchPersonality: exclusive(arg => switchPersonality(arg)),
+            deleteJob: arg => deleteJob(arg),
+            approveSecurity: (arg, el) => approveSecurity(arg, el),
+            denySecurity: (arg, el) => denySecurity(arg, el),
+            toggleChannel: (arg, el) => toggleChannel(arg, el),
+        };
+        function dispatchAction(name, el) {
+            const fn = ACTIONS[name];
+            if(fn) fn(el.dataset.arg, el);
+        }
+        document.body.addEventListener('click', e => {
+            const el = e.target.closest('[data-action]');
+            if(el && !el.disabled) dispatchAction(el.dataset.action, el);
+        }, PASSIVE);
+        document.body.addEventListener('change', e => {
+            if(e.target.dataset.change) dispatchAction(e.target.dataset.change, e.target);
+        }, PASSIVE);
+        document.body.addEventListener('keydown', e => {
+            // Skip Enter while an IME is composing (it confirms the candidate, not the message),
+            // Shift+Enter, and auto-repeat from a held key
+            if(e.key !== 'Enter' || e.isComposing || e.keyCode === 229 || e.shiftKey || e.repeat) return;
+            if(e.target.dataset.enter) dispatchAction(e.target.dataset.enter, e.target);
+        }, PASSIVE);
+
+        // Pause looping animations that are off-screen; removed nodes are dropped on their final notification
+        const ANIMATED = '.pulse, .dot, .security-card';
+        const animObs = new IntersectionObserver(entries => entries.forEach(e => {
+            if(!e.target.isConnected) return animObs.unobserve(e.target);
+            e.target.classList.toggle('anim-offscreen', !e.isIntersecting);
+        }), { rootMargin: '50px' });
+        function watchAnimations(root) {
+            if(root.matches(ANIMATED)) animObs.observe(root);
+            root.querySelectorAll(ANIMATED).forEach(el => animObs.observe(el));
+        }
+        document.addEventListener('visibilitychange', () => {
+            document.documentElement.style.setProperty('--anim-state', document.hidden ? 'paused' : 'running');
+        }, PASSIVE);
+
+        bindRefs();
+        watchAnimations(document.body);
         initDashboard();
         console.log("🦞 YouClaw Dashboard v4.9.5 loaded successfully");
     </script>
@@ -1590,6 +1792,48 @@ DASHBOARD_HTML = """
 </html>
 """
 
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.S)
+
+
+def _minify_css(css):
+    """Strip comments and the whitespace the cascade never sees"""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = ' '.join(css.split())
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    return css.replace(': ', ':').replace(';}', '}')
+
+
+def _minify_html(html):
+    """Conservative minify: markup/JS only lose indentation and comments"""
+    html = _HTML_COMMENT_RE.sub('', html)
+    # Keep line breaks so the inline script never depends on semicolon insertion changes
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+
+# The stylesheet ships as its own content-addressed file: the browser caches it
+# forever and only refetches when a deploy changes the hash in the page's <link>
+_CSS_BYTES = _minify_css(Path(__file__).with_name('dashboard.css').read_text(encoding='utf-8')).encode('utf-8')
+_CSS_GZ = gzip.compress(_CSS_BYTES, 9)
+_CSS_HASH = hashlib.blake2b(_CSS_BYTES, digest_size=6).hexdigest()
+
+# The page never changes at runtime: minify, compress and fingerprint it once
+_HTML_UTF8 = _minify_html(DASHBOARD_HTML.replace('__DASHBOARD_CSS__', f'/static/dashboard.{_CSS_HASH}.css')).encode('utf-8')
+_HTML_ETAG = f'W/"{hashlib.blake2b(_HTML_UTF8, digest_size=8).hexdigest()}"'
+
+
+def _split_after_head(page):
+    """(through </head>, rest) -- plain and as one gzip stream sync-flushed at the split"""
+    cut = page.index(b'</head>') + len(b'</head>')
+    plain = (page[:cut], page[cut:])
+    gz = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    head = gz.compress(plain[0]) + gz.flush(zlib.Z_SYNC_FLUSH)
+    return plain, (head, gz.compress(plain[1]) + gz.flush())
+
+
+_HTML_UTF8_PARTS, _HTML_GZ_PARTS = _split_after_head(_HTML_UTF8)
+
 
 async def run_dashboard(bot_instance=None, port=8080):
     """Run the dashboard web server"""
@@ -9,11 +9,30 @@ import logging
 import json
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+from pathlib import Path
 from .config import config
 from .vector_manager import VectorManager
 
 logger = logging.getLogger(__name__)
 
+# Hot-path SQL, fixed text so nothing is concatenated per call and sqlite3's
+# statement cache always hits
+_SQL_INSERT_MESSAGE = """
+    INSERT INTO conversations 
+    (platform, user_id, channel_id, role, content, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_HISTORY = """
+    SELECT role, content FROM conversations
+    WHERE platform = ? AND user_id = ?
+    ORDER BY timestamp DESC LIMIT ?
+"""
+_SQL_HISTORY_CHANNEL = """
+    SELECT role, content FROM conversations
+    WHERE platform = ? AND user_id = ? AND channel_id = ?
+    ORDER BY timestamp DESC LIMIT ?
+"""
+
 
 class MemoryManager:
     """Manages persistent conversation memory across platforms"""
@@ -22,11 +41,24 @@ class MemoryManager:
         self.db_path = config.bot.database_path
         self.max_context = config.bot.max_context_messages
         self.db: Optional[aiosqlite.Connection] = None
+        # Read-only connection for dashboard GETs; under WAL its reads never wait on self.db's writes
+        self.db_ro: Optional[aiosqlite.Connection] = None
+        # Bumped on every conversations insert/delete so readers can tell cached counts are stale
+        self.conversation_writes = 0
         self.vector_manager = VectorManager(self.db_path)
     
     async def initialize(self):
         """Initialize the database and create tables"""
-        self.db = await aiosqlite.connect(self.db_path)
+        if self.db_ro is not None:
+            return  # Already up (bot and dashboard both call this); don't leak the open connections
+        # sqlite3 keeps an LRU of prepared statements keyed by SQL text; size it for every
+        # fixed query in the bot + dashboard so hot paths never pay sqlite3_prepare again
+        self.db = await aiosqlite.connect(self.db_path, cached_statements=256)
+        # WAL lets dashboard reads run alongside chat writes; NORMAL is durable enough under WAL
+        # and drops the per-commit fsync of the main file. Wait on locks instead of failing fast.
+        await self.db.execute("PRAGMA journal_mode=WAL")
+        await self.db.execute("PRAGMA synchronous=NORMAL")
+        await self.db.execute("PRAGMA busy_timeout=3000")
         await self.vector_manager.initialize()
         
         # Create conversations table
@@ -76,6 +108,15 @@ class MemoryManager:
             )
         """)
 
+        # Single-row table tracking how often global settings changed
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                settings_version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        await self.db.execute("INSERT OR IGNORE INTO meta (id, settings_version) VALUES (1, 0)")
+
         # Create users table for dashboard auth
         await self.db.execute("""
             CREATE TABLE IF NOT EXISTS users (
@@ -119,8 +160,23 @@ class MemoryManager:
             CREATE INDEX IF NOT EXISTS idx_conversations_user 
             ON conversations(platform, user_id, timestamp DESC)
         """)
+        # Covering index for the dashboard's per-channel summary (GROUP BY channel_id)
+        await self.db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conversations_channel 
+            ON conversations(platform, user_id, channel_id, timestamp DESC)
+        """)
+        # Narrow index so COUNT(*) / COUNT(DISTINCT user_id) scan it instead of the table
+        await self.db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conversations_user_id 
+            ON conversations(user_id)
+        """)
         
         await self.db.commit()
+        
+        # Opened after the schema + WAL switch above so the file and tables already exist
+        ro_uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        self.db_ro = await aiosqlite.connect(ro_uri, uri=True, cached_statements=256)
+        await self.db_ro.execute("PRAGMA busy_timeout=3000")
         logger.info(f"Memory manager initialized: {self.db_path}")
 
     def _hash_password(self, password: str) -> str:
@@ -188,6 +244,9 @@ class MemoryManager:
     
     async def close(self):
         """Close the database connection"""
+        if self.db_ro:
+            await self.db_ro.close()
+            self.db_ro = None  # Let a later initialize() reconnect
         if self.db:
             await self.db.close()
             logger.info("Memory manager closed")
@@ -214,13 +273,10 @@ class MemoryManager:
         """
         metadata_json = json.dumps(metadata) if metadata else None
         
-        await self.db.execute("""
-            INSERT INTO conversations 
-            (platform, user_id, channel_id, role, content, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (platform, user_id, channel_id, role, content, metadata_json))
+        await self.db.execute(_SQL_INSERT_MESSAGE, (platform, user_id, channel_id, role, content, metadata_json))
         
         await self.db.commit()
+        self.conversation_writes += 1
 
         # Phase 1: Semantic Indexing
         try:
@@ -246,25 +302,18 @@ class MemoryManager:
             platform: Platform name
             user_id: User identifier
             channel_id: Optional channel filter
-            limit: Max number of messages (defaults to max_context)
+            limit: Max number of messages (defaults to max_context, never above it)
         
         Returns:
             List of message dicts with 'role' and 'content'
         """
-        limit = limit or self.max_context
-        
-        query = """
-            SELECT role, content FROM conversations
-            WHERE platform = ? AND user_id = ?
-        """
-        params = [platform, user_id]
+        # Hard cap: the index-backed LIMIT keeps the rows read and the list built bounded
+        limit = min(limit or self.max_context, self.max_context)
         
         if channel_id:
-            query += " AND channel_id = ?"
-            params.append(channel_id)
-        
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
+            query, params = _SQL_HISTORY_CHANNEL, (platform, user_id, channel_id, limit)
+        else:
+            query, params = _SQL_HISTORY, (platform, user_id, limit)
         
         async with self.db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
@@ -293,6 +342,7 @@ class MemoryManager:
         
         await self.db.execute(query, params)
         await self.db.commit()
+        self.conversation_writes += 1
         logger.info(f"Cleared conversation for {platform}:{user_id}")
     
     async def set_user_preference(
@@ -380,14 +430,44 @@ class MemoryManager:
             row = await cursor.fetchone()
             return row[0] if row else default
 
+    async def get_global_settings(self, keys) -> Dict[str, str]:
+        """Get several global settings in one query; missing keys are left out"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        async with self.db.execute(
+            f"SELECT setting_key, setting_value FROM global_settings WHERE setting_key IN ({placeholders})",
+            keys
+        ) as cursor:
+            return {key: value for key, value in await cursor.fetchall()}
+
     async def set_global_setting(self, key: str, value: str):
         """Set a global setting"""
         await self.db.execute("""
             INSERT OR REPLACE INTO global_settings (setting_key, setting_value, last_updated)
             VALUES (?, ?, CURRENT_TIMESTAMP)
         """, (key, str(value)))
+        await self.db.execute("UPDATE meta SET settings_version = settings_version + 1 WHERE id = 1")
         await self.db.commit()
 
+    async def set_global_settings(self, settings: Dict[str, str]):
+        """Set several global settings in a single transaction"""
+        if not settings:
+            return
+        await self.db.executemany("""
+            INSERT OR REPLACE INTO global_settings (setting_key, setting_value, last_updated)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """, [(key, str(value)) for key, value in settings.items()])
+        await self.db.execute("UPDATE meta SET settings_version = settings_version + 1 WHERE id = 1")
+        await self.db.commit()
+
+    async def get_settings_version(self) -> int:
+        """Counter bumped on every set_global_setting; lets readers skip unchanged reloads"""
+        async with self.db.execute("SELECT settings_version FROM meta WHERE id = 1") as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else 0
+
     async def get_user_secret(self, platform: str, user_id: str, key: str, default: str = None) -> str:
         """Get a user-specific secret (e.g., personal API key)"""
         async with self.db.execute("""
@@ -46,15 +46,23 @@ class OllamaClient:
     
     async def initialize(self):
         """Initialize the HTTP session"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        )
+        # Request URLs are built from config.ollama.host on every call, so a host change
+        # doesn't need a new session; keep the pooled keep-alive connections (and any
+        # in-flight streams) instead of leaking the old session on re-init
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                # Hold idle keep-alive sockets longer than aiohttp's 15s default so chats
+                # a minute apart still skip the TCP (and TLS) handshake; cache DNS for remote hosts
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=75, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
         logger.info(f"Ollama client initialized: {self.host} (model: {self.model})")
     
     async def close(self):
         """Close the HTTP session"""
         if self.session:
             await self.session.close()
+            self.session = None
             logger.info("Ollama client closed")
     
     async def check_health(self) -> bool:
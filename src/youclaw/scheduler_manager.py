@@ -6,7 +6,8 @@ Handles background tasks, heartbeats, and proactive notifications.
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from typing import Dict, Any, Callable, Optional
+from apscheduler.events import EVENT_JOB_ADDED, EVENT_JOB_REMOVED, EVENT_ALL_JOBS_REMOVED
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
 from datetime import datetime
 import asyncio
 
@@ -18,6 +19,10 @@ class SchedulerManager:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self.bot_instance = None
+        # Secondary index over job.args[0:2]: (platform, user_id) -> job ids, plus the
+        # reverse map. Kept in sync from scheduler events so per-user lookups skip get_jobs().
+        self._jobs_by_user: Dict[Tuple[str, str], Set[str]] = {}
+        self._job_owner: Dict[str, Tuple[str, str]] = {}
     
     def initialize(self, bot_instance, db_path: str):
         """Initialize the scheduler with persistence"""
@@ -29,9 +34,60 @@ class SchedulerManager:
         }
         
         self.scheduler.configure(jobstores=job_stores)
+        self.scheduler.add_listener(self._on_job_event, EVENT_JOB_ADDED | EVENT_JOB_REMOVED | EVENT_ALL_JOBS_REMOVED)
         self.scheduler.start()
+        
+        # Jobs restored from the persistent store don't emit EVENT_JOB_ADDED
+        for job in self.scheduler.get_jobs():
+            self.index_add(job)
         logger.info("Scheduler initialized and started")
 
+    def index_add(self, job):
+        """Record a job under the (platform, user_id) it was scheduled for"""
+        if len(job.args) < 2:
+            return
+        self.index_remove(job.id)  # replace_existing may re-add an id under new args
+        key = (job.args[0], job.args[1])
+        self._jobs_by_user.setdefault(key, set()).add(job.id)
+        self._job_owner[job.id] = key
+
+    def index_remove(self, job_id: str):
+        """Forget a job id (no-op if it was never indexed)"""
+        key = self._job_owner.pop(job_id, None)
+        if key is None:
+            return
+        ids = self._jobs_by_user.get(key)
+        if ids is not None:
+            ids.discard(job_id)
+            if not ids:
+                del self._jobs_by_user[key]
+
+    def _on_job_event(self, event):
+        """Keep the per-user index in step with the scheduler"""
+        if event.code == EVENT_ALL_JOBS_REMOVED:
+            self._jobs_by_user.clear()
+            self._job_owner.clear()
+        elif event.code == EVENT_JOB_REMOVED:
+            self.index_remove(event.job_id)
+        else:
+            job = self.scheduler.get_job(event.job_id, event.jobstore)
+            if job:
+                self.index_add(job)
+
+    def owns_job(self, platform: str, user_id: str, job_id: str) -> bool:
+        """True if job_id was scheduled for this platform user"""
+        return self._job_owner.get(job_id) == (platform, user_id)
+
+    def jobs_for(self, platform: str, user_id: str) -> List:
+        """Jobs scheduled for one platform user, soonest first"""
+        jobs = []
+        for job_id in tuple(self._jobs_by_user.get((platform, user_id), ())):
+            job = self.scheduler.get_job(job_id)
+            if job:
+                jobs.append(job)
+        jobs.sort(key=lambda j: (j.next_run_time is None, j.next_run_time or 0))
+        return jobs
+
     async def add_notification_job(
         self, 
         platform: str, 
@@ -23,6 +23,7 @@ class VectorManager:
     async def initialize(self):
         """Initialize the vector database table"""
         self.db = await aiosqlite.connect(self.db_path)
+        await self.db.execute("PRAGMA busy_timeout=3000") # Same file as memory_manager; wait out its write locks
         await self.db.execute("""
             CREATE TABLE IF NOT EXISTS vector_memory (
                 message_id INTEGER PRIMARY KEY,